@@ -4,15 +4,23 @@ A utility module for pulling data from the AdventOfCode site.
 """
 import sys
 from typing import Optional
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import date
 import argparse
+import hashlib
+import json
 import logging
+import os
+import re
+import threading
+import time
 
 import requests
 
 
 SESSION_KEY_FILENAME = "session_key.txt"
+CACHE_DIRNAME = ".cache"
 
 URL_TMPL = "https://adventofcode.com/{year}/day/{day}{path}"
 USER_AGENT = "https://github.com/tomp/AOC-2023 by pollard.tom@gmail.com"
@@ -22,6 +30,19 @@ THIS_DAY = str(date.today().day)
 
 BASE_DIR = Path(__file__).parent
 
+# Puzzle descriptions change when part 2 unlocks, so cached copies are
+# revalidated after this many seconds.  Inputs never change, and are kept
+# forever.
+PAGE_TTL = 15 * 60
+INPUT_PATH = "/input"
+
+# Be polite: space requests out, and back off when the server is struggling.
+REQUEST_INTERVAL = 0.5
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 
 logging.basicConfig(format="%(message)s", stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -46,6 +67,116 @@ def add_arguments(parser: argparse.ArgumentParser) -> None:
         default=SESSION_KEY_FILENAME,
         help="name of text file containing the session key",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=CACHE_DIRNAME,
+        help="directory in which downloaded pages are cached",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always download pages, bypassing the cache",
+    )
+
+
+@dataclass
+class CacheEntry:
+    """What the cache knows about one downloaded page."""
+    url: str
+    digest: str
+    encoding: str
+    fetched_at: float
+    ttl: Optional[float]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        if self.ttl is None:
+            return True
+        return (now or time.time()) - self.fetched_at < self.ttl
+
+
+class PageCache:
+    """An on-disk cache of downloaded pages.
+
+    Page bodies are stored content-addressed, under objects/ by their SHA-256
+    digest.  An index entry for each (year, day, path) records which body it
+    holds, along with the ETag and Last-Modified headers used to revalidate
+    it.  The index is kept separately for each session key, since inputs
+    differ from user to user.  All writes are atomic.
+
+    Derived forms of a body (e.g. its markdown conversion) can be stored next
+    to it, keyed by the body's digest and the kind of conversion.
+    """
+
+    def __init__(self, cache_dir, session_key: str = ""):
+        self.cache_dir = Path(cache_dir)
+        user = hashlib.sha256(session_key.encode()).hexdigest()[:16] if session_key else "anonymous"
+        self.index_dir = self.cache_dir / "index" / user
+        self.objects_dir = self.cache_dir / "objects"
+
+    def _index_path(self, year: str, day: str, path: str) -> Path:
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", path.strip("/")) or "index"
+        return self.index_dir / str(year) / str(day) / f"{name}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+    def lookup(self, year: str, day: str, path: str) -> Optional[CacheEntry]:
+        index_path = self._index_path(year, day, path)
+        try:
+            entry = CacheEntry(**json.loads(index_path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not self._object_path(entry.digest).is_file():
+            return None
+        return entry
+
+    def read(self, entry: CacheEntry) -> bytes:
+        return self._object_path(entry.digest).read_bytes()
+
+    def store(self, year: str, day: str, path: str, entry: CacheEntry, content: bytes) -> None:
+        object_path = self._object_path(entry.digest)
+        if not object_path.is_file():
+            self._write_atomic(object_path, content)
+        self.update(year, day, path, entry)
+
+    def load_derived(self, digest: str, kind: str) -> Optional[str]:
+        try:
+            return self._object_path(digest).with_suffix(f".{kind}").read_text()
+        except OSError:
+            return None
+
+    def store_derived(self, digest: str, kind: str, text: str) -> None:
+        self._write_atomic(self._object_path(digest).with_suffix(f".{kind}"), text.encode())
+
+    def update(self, year: str, day: str, path: str, entry: CacheEntry) -> None:
+        index_path = self._index_path(year, day, path)
+        self._write_atomic(index_path, json.dumps(asdict(entry), indent=2).encode())
+
+
+class RateLimiter:
+    """Spaces out calls to wait() at least interval seconds apart, across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
 
 
 class Client:
@@ -59,19 +190,35 @@ class Client:
         year: Optional[str] = None,
         day: Optional[str] = None,
         session: Optional[str] = None,
+        cache_dir: Optional[str] = CACHE_DIRNAME,
+        page_ttl: Optional[float] = PAGE_TTL,
+        url_tmpl: str = URL_TMPL,
+        request_interval: float = REQUEST_INTERVAL,
+        max_retries: int = MAX_RETRIES,
+        retry_backoff: float = RETRY_BACKOFF,
     ):
         self.year = year or THIS_YEAR
         self.day = day or THIS_DAY
         self.session_filename = session
+        self.page_ttl = page_ttl
+        self.url_tmpl = url_tmpl
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.rate_limiter = RateLimiter(request_interval)
 
         self._headers = {"User-Agent": USER_AGENT}
         self._cookies = {}
 
+        session_key = ""
         if self.session_filename:
             session_file = str(BASE_DIR / self.session_filename)
             session_key = Path(session_file).read_text().strip()
             self._cookies["session"] = session_key
 
+        self.cache = None
+        if cache_dir:
+            self.cache = PageCache(BASE_DIR / cache_dir, session_key)
+
         self.session = requests.Session()
 
     def get_page(
@@ -79,18 +226,85 @@ class Client:
         year: str = "",
         day: str = "",
         path: str = "",
-        raw: bool = False
+        raw: bool = False,
+        check: bool = False,
     ):
+        """Return the text of a page, from the cache if possible.
+
+        If check is set, an error response raises requests.HTTPError.
+        """
         if not year:
             year = self.year
         if not day:
             day = self.day
         if path and not path.startswith("/"):
             path = "/" + path
-        url = URL_TMPL.format(year=year, day=day, path=path)
-        resp = self.session.get(url, headers=self._headers, cookies=self._cookies)
+        url = self.url_tmpl.format(year=year, day=day, path=path)
+
+        entry = self.cache.lookup(year, day, path) if self.cache else None
+        if entry and entry.is_fresh():
+            logger.debug(f"CACHED: {url}")
+            return self._decode(self.cache.read(entry), entry.encoding, raw)
+
+        headers = dict(self._headers)
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        resp = self._fetch(url, headers)
         logger.debug(f"REQ: {resp.request.url}")
         logger.debug(f"OK: {resp.ok}")
+
+        if entry and resp.status_code == 304:
+            logger.debug(f"NOT MODIFIED: {url}")
+            entry.fetched_at = time.time()
+            self.cache.update(year, day, path, entry)
+            return self._decode(self.cache.read(entry), entry.encoding, raw)
+
+        if check:
+            resp.raise_for_status()
+        encoding = resp.encoding or "utf-8"
+        if self.cache and resp.ok:
+            entry = CacheEntry(
+                url=url,
+                digest=hashlib.sha256(resp.content).hexdigest(),
+                encoding=encoding,
+                fetched_at=time.time(),
+                ttl=None if path == INPUT_PATH else self.page_ttl,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+            self.cache.store(year, day, path, entry, resp.content)
+        return self._decode(resp.content, encoding, raw)
+
+    def _fetch(self, url: str, headers: dict) -> requests.Response:
+        """GET a url, rate-limited, retrying connection errors and
+        transient error responses with exponential backoff.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.wait()
+            try:
+                resp = self.session.get(
+                    url, headers=headers, cookies=self._cookies, timeout=REQUEST_TIMEOUT
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self.max_retries:
+                    raise
+                logger.debug(f"RETRY {url}: {exc}")
+                delay = self.retry_backoff * 2**attempt
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    return resp
+                logger.debug(f"RETRY {url}: HTTP {resp.status_code}")
+                delay = self.retry_backoff * 2**attempt
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+            time.sleep(delay)
+
+    @staticmethod
+    def _decode(content: bytes, encoding: str, raw: bool) -> str:
         if raw:
-            return resp.content.decode()
-        return resp.text
+            return content.decode()
+        return content.decode(encoding, errors="replace")
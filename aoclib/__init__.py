@@ -0,0 +1,32 @@
+"""
+Shared helpers for the daily Advent of Code solutions.
+"""
+from aoclib.loader import (
+    Lines,
+    Sections,
+    Grid,
+    load_input,
+    load_text,
+    load_bytes,
+    map_bytes,
+    line_chunks,
+    load_sections,
+    load_grid,
+    parse_sections,
+    parse_grid,
+)
+
+__all__ = [
+    "Lines",
+    "Sections",
+    "Grid",
+    "load_input",
+    "load_text",
+    "load_bytes",
+    "map_bytes",
+    "line_chunks",
+    "load_sections",
+    "load_grid",
+    "parse_sections",
+    "parse_grid",
+]
@@ -0,0 +1,113 @@
+"""
+Input loading for the daily solutions.
+
+Every loader here makes a single pass over the input text: the text is split
+once, and stripping and blank-line filtering happen in the same comprehension,
+so no intermediate line lists are built.
+"""
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+from contextlib import contextmanager
+from pathlib import Path
+import mmap
+
+Lines = Sequence[str]
+Sections = Sequence[Lines]
+Grid = List[List]
+
+PathLike = Union[str, Path]
+
+NEWLINE_WINDOW = 1 << 16
+
+
+def load_input(infile: PathLike, strip=True, blank_lines=False) -> Lines:
+    """Read a file and split it into lines, as load_text() does."""
+    return load_text(Path(infile).read_text(), strip, blank_lines)
+
+def load_text(text: str, strip=True, blank_lines=False) -> Lines:
+    """Split text into lines.
+
+    Leading and trailing newlines are dropped.  If strip is set, each line is
+    stripped of surrounding whitespace.  Unless blank_lines is set, lines that
+    contain only whitespace are dropped.
+    """
+    rows = text.strip("\n").split("\n")
+    if strip:
+        if blank_lines:
+            return [line.strip() for line in rows]
+        return [stripped for line in rows if (stripped := line.strip())]
+    if blank_lines:
+        return rows
+    return [line for line in rows if line and not line.isspace()]
+
+def load_bytes(infile: PathLike) -> bytes:
+    """Return the raw contents of a file."""
+    return Path(infile).read_bytes()
+
+@contextmanager
+def map_bytes(infile: PathLike) -> Iterator[memoryview]:
+    """Memory-map a file and yield a read-only view of its bytes.
+
+    Slicing the view does not copy.  The view is only valid inside the
+    `with` block.
+    """
+    with Path(infile).open("rb") as fp:
+        if fp.seek(0, 2) == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
+
+def line_chunks(data, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """Split a buffer into (start, end) ranges of whole lines.
+
+    Each range is at least chunk_size bytes long (except the last) and ends
+    just after a newline, so no line is cut in two.  A line longer than
+    chunk_size makes its range longer.  Only a small window is copied while
+    looking for each newline, so this works on a map_bytes() view.
+    """
+    size = len(data)
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        while end < size:
+            window = bytes(data[end - 1:end - 1 + NEWLINE_WINDOW])
+            i = window.find(b"\n")
+            if i >= 0:
+                end += i
+                break
+            end += len(window)
+        yield start, min(end, size)
+        start = end
+
+def load_sections(infile: PathLike, strip=True) -> Sections:
+    """Read a file and split it into blank-line separated sections."""
+    return parse_sections(load_input(infile, strip, blank_lines=True))
+
+def load_grid(infile: PathLike, cast: Optional[Callable] = None) -> Grid:
+    """Read a file as a rectangular grid of characters (or cast values)."""
+    return parse_grid(load_input(infile), cast)
+
+def parse_sections(lines: Lines) -> Sections:
+    """Group lines into sections, separated by blank lines."""
+    result = []
+    sect = []
+    for line in lines:
+        if not line or line.isspace():
+            if sect:
+                result.append(sect)
+                sect = []
+        else:
+            sect.append(line)
+    if sect:
+        result.append(sect)
+    return result
+
+def parse_grid(lines: Lines, cast: Optional[Callable] = None) -> Grid:
+    """Split each line into a row of characters, optionally applying cast."""
+    if cast is None:
+        return [list(line) for line in lines]
+    return [list(map(cast, line)) for line in lines]
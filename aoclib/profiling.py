@@ -0,0 +1,83 @@
+"""
+Profiling helpers: run a function under cProfile and save the results, both
+as a .pstats file and as collapsed stacks for flamegraph tools.
+
+cProfile only records caller/callee pairs, not whole stacks, so the collapsed
+stacks are reconstructed from the call graph: a function's time is shared
+among the paths that reach it in proportion to the time each caller spent in
+it.  That's exact for call trees, and a close estimate otherwise.
+"""
+from typing import Any, Callable, Dict, Tuple
+from pathlib import Path
+import cProfile
+import pstats
+
+# Recursion deeper than this is folded into its frame at the limit
+MAX_STACK_DEPTH = 64
+
+Func = Tuple[str, int, str]
+
+
+def profile_call(func: Callable, *args, **kwargs) -> Tuple[Any, pstats.Stats]:
+    """Call func under cProfile, and return its result and the profile stats."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    return result, pstats.Stats(profiler)
+
+def save_profile(stats: pstats.Stats, path_stem: Path) -> Tuple[Path, Path]:
+    """Write stats to <path_stem>.pstats and <path_stem>.collapsed."""
+    path_stem = Path(path_stem)
+    path_stem.parent.mkdir(parents=True, exist_ok=True)
+    pstats_path = path_stem.with_name(path_stem.name + ".pstats")
+    collapsed_path = path_stem.with_name(path_stem.name + ".collapsed")
+    stats.dump_stats(str(pstats_path))
+    lines = [
+        f"{stack} {round(seconds * 1e6)}"
+        for stack, seconds in collapse_stats(stats).items()
+        if round(seconds * 1e6) > 0
+    ]
+    collapsed_path.write_text("\n".join(lines) + "\n")
+    return pstats_path, collapsed_path
+
+def func_label(func: Func) -> str:
+    """Return a flamegraph frame name for a pstats function key."""
+    filename, lineno, name = func
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{Path(filename).name}:{name}:{lineno}".replace(";", ",")
+
+def collapse_stats(stats: pstats.Stats) -> Dict[str, float]:
+    """Return the self time, in seconds, of each reconstructed call stack,
+    keyed by the stack's ';'-joined frame names (outermost first).
+    """
+    entries = stats.stats
+    callees: Dict[Func, Dict[Func, float]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, edge_cumtime) in callers.items():
+            callees.setdefault(caller, {})[func] = edge_cumtime
+
+    roots = [
+        func for func, (_, _, _, _, callers) in entries.items()
+        if not callers or all(caller not in entries for caller in callers)
+    ]
+    stacks: Dict[str, float] = {}
+
+    def walk(func: Func, stack: Tuple[str, ...], on_stack: frozenset, share: float) -> None:
+        _, _, tottime, cumtime, _ = entries[func]
+        stack = stack + (func_label(func),)
+        key = ";".join(stack)
+        if len(stack) >= MAX_STACK_DEPTH:
+            stacks[key] = stacks.get(key, 0.0) + cumtime * share
+            return
+        stacks[key] = stacks.get(key, 0.0) + tottime * share
+        for callee, edge_cumtime in callees.get(func, {}).items():
+            if callee in on_stack:
+                continue
+            callee_cumtime = entries[callee][3]
+            if callee_cumtime <= 0:
+                continue
+            walk(callee, stack, on_stack | {callee}, share * edge_cumtime / callee_cumtime)
+
+    for root in roots:
+        walk(root, (), frozenset([root]), 1.0)
+    return stacks
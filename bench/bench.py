@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Benchmark the daily solutions, and check them against a stored baseline.
+
+For each requested day and part, the solver is first checked against the
+module's SAMPLE_CASES (SAMPLE_CASES2 for part 2), then timed against the
+day's input file: a few warmup runs, then a number of timed repetitions.
+Outliers are dropped (Tukey's fences, 1.5 IQR) before the median, p95 and
+mean are computed.
+
+Results can be saved as a JSON baseline, and compared against one; the
+comparison fails if any part's median has slowed down by more than the
+threshold.
+"""
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from types import ModuleType
+import argparse
+import json
+import logging
+import statistics
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+import run
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+
+
+logging.basicConfig(format="%(message)s", stream=sys.stderr, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SampleError(Exception):
+    """A SampleError is raised when a solver gets a sample case wrong."""
+
+
+@dataclass
+class BenchResult:
+    """Timing statistics, in seconds, for one part of one day's puzzle."""
+    day: int
+    part: int
+    infile: str
+    answer: Any
+    runs: int
+    outliers: int
+    median: float
+    p95: float
+    mean: float
+    stdev: float
+    best: float
+
+    @property
+    def key(self) -> str:
+        return f"day{self.day}/part{self.part}:{self.infile}"
+
+
+def clear_caches(module: ModuleType) -> None:
+    """Clear any functools caches in a day's module, so every run starts cold."""
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+
+def check_samples(day: int, part: int) -> int:
+    """Check a solver against its sample cases; return the number checked."""
+    module = run.load_day(day)
+    solver = getattr(module, run.PART_FUNCS[part])
+    cases = module.SAMPLE_CASES if part == 1 else module.SAMPLE_CASES2
+    for text, expected in cases:
+        result = solver(module.load_text(text))
+        if result != expected:
+            raise SampleError(
+                f"day {day} part {part}: got {result} for sample, expected {expected}"
+            )
+    clear_caches(module)
+    return len(cases)
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the pct'th percentile of values, interpolating between ranks."""
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * pct / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+def reject_outliers(values: Sequence[float]) -> List[float]:
+    """Drop values outside Tukey's fences (1.5 IQR beyond the quartiles)."""
+    if len(values) < 4:
+        return list(values)
+    q1 = percentile(values, 25)
+    q3 = percentile(values, 75)
+    fence = 1.5 * (q3 - q1)
+    return [value for value in values if q1 - fence <= value <= q3 + fence]
+
+def bench_part(
+    day: int,
+    part: int,
+    infile: Optional[str] = None,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+) -> BenchResult:
+    """Time one part of one day against its input file."""
+    module = run.load_day(day)
+    solver = getattr(module, run.PART_FUNCS[part])
+    path = str(run.input_path(module, infile))
+
+    timings = []
+    answer = None
+    for i in range(warmup + repeat):
+        lines = module.load_input(path)
+        clear_caches(module)
+        start = time.perf_counter()
+        answer = solver(lines)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+
+    kept = reject_outliers(timings)
+    return BenchResult(
+        day=day,
+        part=part,
+        infile=infile or module.INPUTFILE,
+        answer=answer,
+        runs=len(timings),
+        outliers=len(timings) - len(kept),
+        median=statistics.median(kept),
+        p95=percentile(kept, 95),
+        mean=statistics.mean(kept),
+        stdev=statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        best=min(kept),
+    )
+
+
+# Baselines
+
+def save_baseline(results: Sequence[BenchResult], path: Path) -> None:
+    """Merge results into the baseline file at path."""
+    baseline = load_baseline(path) if path.exists() else {}
+    for result in results:
+        baseline[result.key] = asdict(result)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(baseline, indent=2, sort_keys=True, default=str))
+    tmp_path.replace(path)
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    return json.loads(path.read_text())
+
+def find_regressions(
+    results: Sequence[BenchResult],
+    baseline: Dict[str, Dict],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Return a message for each result whose median is slower than the baseline
+    median by more than threshold (a fraction), or whose answer has changed.
+    """
+    messages = []
+    for result in results:
+        base = baseline.get(result.key)
+        if base is None:
+            logger.info(f"{result.key}: no baseline")
+            continue
+        if str(result.answer) != str(base["answer"]):
+            messages.append(
+                f"{result.key}: answer {result.answer} differs from baseline {base['answer']}"
+            )
+        ratio = result.median / base["median"] if base["median"] else 1.0
+        if ratio > 1 + threshold:
+            messages.append(
+                f"{result.key}: median {result.median * 1000:.2f}ms is {ratio:.2f}x"
+                f" the baseline {base['median'] * 1000:.2f}ms"
+            )
+    return messages
+
+
+# Output
+
+def format_table(results: Sequence[BenchResult]) -> str:
+    header = ("day", "part", "input", "runs", "outliers", "median", "p95", "mean", "stdev", "best")
+    rows = [header]
+    for r in results:
+        rows.append((
+            str(r.day),
+            str(r.part),
+            r.infile,
+            str(r.runs),
+            str(r.outliers),
+            *(f"{value * 1000:.2f}ms" for value in (r.median, r.p95, r.mean, r.stdev, r.best)),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in rows
+    )
+
+
+# Command line
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the daily solutions against their input files."
+    )
+    run.add_arguments(parser)
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=DEFAULT_WARMUP,
+        help=f"Untimed runs before timing each part (default: {DEFAULT_WARMUP})",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Timed runs of each part (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--save",
+        nargs="?",
+        const=str(DEFAULT_BASELINE),
+        help="Save the results to a JSON baseline file",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=str(DEFAULT_BASELINE),
+        help="Fail if any part is slower than in this JSON baseline file",
+    )
+    parser.add_argument(
+        "--threshold",
+        "-t",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown against the baseline, as a fraction"
+        f" (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Produce debug output",
+    )
+    opt = parser.parse_args()
+
+    if opt.repeat < 1:
+        raise run.UsageError("--repeat must be at least 1")
+    if opt.warmup < 0:
+        raise run.UsageError("--warmup can't be negative")
+    if opt.input and len(opt.input) > 1:
+        raise run.UsageError("only one --input can be benchmarked at a time")
+    return opt
+
+def main() -> int:
+    opt = parse_args()
+    if opt.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("[debug mode]")
+
+    results = []
+    for day, part, infile in run.select_jobs(opt):
+        ncases = check_samples(day, part)
+        logger.debug(f"day {day} part {part}: {ncases} sample case(s) passed")
+        results.append(bench_part(day, part, infile, opt.warmup, opt.repeat))
+    print(format_table(results))
+
+    status = 0
+    if opt.compare:
+        regressions = find_regressions(results, load_baseline(Path(opt.compare)), opt.threshold)
+        for message in regressions:
+            logger.error(f"REGRESSION {message}")
+        if regressions:
+            status = 1
+    if opt.save:
+        save_baseline(results, Path(opt.save))
+        logger.info(f"Wrote {opt.save}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
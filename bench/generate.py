@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Write a synthetic input for one day's puzzle.
+
+    ./bench/generate.py --day 17 --scale 100 --outfile /tmp/day17_x100.txt
+"""
+import sys
+from pathlib import Path
+import argparse
+import logging
+
+import generators
+
+
+logging.basicConfig(format="%(message)s", stream=sys.stderr, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Write a synthetic puzzle input of a given size."
+    )
+    parser.add_argument(
+        "--day",
+        "-d",
+        type=int,
+        required=True,
+        choices=generators.available_days(),
+        help="The day of the puzzle",
+    )
+    parser.add_argument(
+        "--scale",
+        "-s",
+        type=float,
+        default=1.0,
+        help="Size relative to the real input (default: 1)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=generators.DEFAULT_SEED,
+        help=f"Random seed (default: {generators.DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--outfile",
+        "-o",
+        help="The file to which to write the input (default: stdout)",
+    )
+    return parser.parse_args()
+
+def main() -> int:
+    opt = parse_args()
+    if opt.outfile:
+        generators.write_input(opt.day, Path(opt.outfile), opt.scale, opt.seed)
+        logger.info(f"Wrote {opt.outfile}")
+    else:
+        sys.stdout.write(generators.generate(opt.day, opt.scale, opt.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Synthetic puzzle inputs for stress-testing the daily solutions.
+
+There's one module per day, dayN.py, each providing
+
+    generate(scale=1.0, seed=DEFAULT_SEED) -> str
+
+which returns the text of a valid input for that day's puzzle.  At scale 1
+the input is about the size of the real input.txt; larger scales grow it
+roughly in proportion (more lines, or more cells for grid puzzles).  The
+same (scale, seed) always produces the same text.
+"""
+from typing import Callable, List
+from pathlib import Path
+import importlib
+import re
+
+from generators.common import DEFAULT_SEED
+
+GENERATOR_DIR = Path(__file__).parent
+
+DAY_MODULE_RE = re.compile(r"^day(\d+)\.py$")
+
+
+def available_days() -> List[int]:
+    """Return the days that have a generator."""
+    days = []
+    for path in GENERATOR_DIR.iterdir():
+        m = DAY_MODULE_RE.match(path.name)
+        if m:
+            days.append(int(m.group(1)))
+    return sorted(days)
+
+def get_generator(day: int) -> Callable[..., str]:
+    """Return the generate() function for the given day."""
+    module = importlib.import_module(f"generators.day{day}")
+    return module.generate
+
+def generate(day: int, scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    """Return the text of a synthetic input for the given day."""
+    return get_generator(day)(scale, seed)
+
+def write_input(day: int, path: Path, scale: float = 1.0, seed: int = DEFAULT_SEED) -> Path:
+    """Write a synthetic input for the given day to path, and return the path."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(generate(day, scale, seed))
+    tmp_path.replace(path)
+    return path
@@ -0,0 +1,128 @@
+"""
+Helpers shared by the per-day input generators.
+"""
+from typing import List, Sequence, Tuple
+from random import Random
+import math
+import string
+
+DEFAULT_SEED = 2023
+
+Point = Tuple[int, int]
+
+UP = (-1, 0)
+DOWN = (1, 0)
+LEFT = (0, -1)
+RIGHT = (0, 1)
+
+
+def scaled(base: int, scale: float) -> int:
+    """Scale a count, keeping it at least 1."""
+    return max(1, round(base * scale))
+
+def grid_side(base: int, scale: float) -> int:
+    """Scale the side of a square grid, so its area grows by scale."""
+    return max(1, round(base * math.sqrt(scale)))
+
+def join_lines(lines: Sequence[str]) -> str:
+    return "\n".join(lines) + "\n"
+
+def make_names(
+    count: int,
+    rng: Random,
+    alphabet: str = string.ascii_lowercase,
+    last_alphabet: str = "",
+    min_length: int = 2,
+    exclude: Sequence[str] = (),
+) -> List[str]:
+    """Return count distinct random names, as short as they can be.
+
+    If last_alphabet is given, the last character of each name is drawn from
+    it instead of from alphabet.
+    """
+    last_alphabet = last_alphabet or alphabet
+    exclude = set(exclude)
+    length = min_length
+    while len(last_alphabet) * len(alphabet) ** (length - 1) < 2 * (count + len(exclude)):
+        length += 1
+    space = len(last_alphabet) * len(alphabet) ** (length - 1)
+
+    names = []
+    seen = set(exclude)
+    for index in rng.sample(range(space), count + len(exclude)):
+        index, last = divmod(index, len(last_alphabet))
+        chars = [last_alphabet[last]]
+        for _ in range(length - 1):
+            index, pos = divmod(index, len(alphabet))
+            chars.append(alphabet[pos])
+        name = "".join(reversed(chars))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+        if len(names) == count:
+            break
+    return names
+
+
+# Rectilinear loops
+
+def column_region(width: int, height: int, rng: Random) -> Tuple[List[int], List[int]]:
+    """Return a random simply-connected region of cells in a width x height grid.
+
+    The region is column-convex: column x covers rows top[x] <= row < bottom[x],
+    and each column overlaps its neighbour by at least one cell, so the
+    region's boundary is a single loop that never touches itself.
+    """
+    step = max(1, height // 4)
+    top = [rng.randrange(0, max(1, height // 2))]
+    bottom = [rng.randrange(top[0] + 1, height + 1)]
+    for _ in range(1, width):
+        t, b = top[-1], bottom[-1]
+        nt = min(max(t + rng.randint(-step, step), 0), b - 1)
+        nb = min(max(b + rng.randint(-step, step), max(t, nt) + 1), height)
+        top.append(nt)
+        bottom.append(nb)
+    return top, bottom
+
+def region_corners(top: Sequence[int], bottom: Sequence[int]) -> List[Point]:
+    """Return the corners of the boundary of a column region, clockwise,
+    as (row, col) lattice points.  Collinear points are dropped.
+    """
+    width = len(top)
+    points = []
+    for x in range(width):
+        points += [(top[x], x), (top[x], x + 1)]
+    for x in reversed(range(width)):
+        points += [(bottom[x], x + 1), (bottom[x], x)]
+
+    corners = []
+    for point in points:
+        if corners and corners[-1] == point:
+            continue
+        if len(corners) >= 2 and _collinear(corners[-2], corners[-1], point):
+            corners[-1] = point
+        else:
+            corners.append(point)
+    while len(corners) > 2 and _collinear(corners[-2], corners[-1], corners[0]):
+        corners.pop()
+    while len(corners) > 2 and _collinear(corners[-1], corners[0], corners[1]):
+        corners.pop(0)
+    return corners
+
+def _collinear(p0: Point, p1: Point, p2: Point) -> bool:
+    return (p0[0] == p1[0] == p2[0]) or (p0[1] == p1[1] == p2[1])
+
+def corner_path(corners: Sequence[Point]) -> List[Point]:
+    """Expand a closed loop of corners into every lattice point along it."""
+    path = []
+    for i, (r0, c0) in enumerate(corners):
+        r1, c1 = corners[(i + 1) % len(corners)]
+        dr = (r1 > r0) - (r1 < r0)
+        dc = (c1 > c0) - (c1 < c0)
+        steps = abs(r1 - r0) + abs(c1 - c0)
+        path += [(r0 + dr * k, c0 + dc * k) for k in range(steps)]
+    return path
+
+def direction(p0: Point, p1: Point) -> Point:
+    """Return the unit direction from p0 towards p1, along a row or column."""
+    return ((p1[0] > p0[0]) - (p1[0] < p0[0]), (p1[1] > p0[1]) - (p1[1] < p0[1]))
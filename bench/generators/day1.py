@@ -0,0 +1,30 @@
+"""
+Day 1: calibration lines mixing letters, digits and spelled-out digits.
+"""
+from random import Random
+import string
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_LINES = 1000
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def make_line(rng: Random) -> str:
+    tokens = []
+    for _ in range(rng.randint(1, 7)):
+        r = rng.random()
+        if r < 0.25:
+            tokens.append(rng.choice("123456789"))
+        elif r < 0.55:
+            tokens.append(rng.choice(DIGIT_WORDS))
+        else:
+            tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+    # part 1 needs at least one numeric digit on every line
+    tokens.insert(rng.randrange(len(tokens) + 1), rng.choice("123456789"))
+    return "".join(tokens)
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    return join_lines([make_line(rng) for _ in range(scaled(BASE_LINES, scale))])
@@ -0,0 +1,48 @@
+"""
+Day 10: a field of pipes containing one closed loop through S.
+
+The loop is the boundary of a random column-convex region, so it never
+touches itself.  S replaces a loop tile that isn't an L or a 7, and the tiles
+around S that aren't on the loop are cleared, so S has exactly two
+connections.
+"""
+from random import Random
+
+from generators.common import (
+    DEFAULT_SEED, DOWN, LEFT, RIGHT, UP,
+    column_region, corner_path, direction, grid_side, join_lines, region_corners,
+)
+
+BASE_SIDE = 140
+
+PIPES = {
+    frozenset((UP, DOWN)): "|",
+    frozenset((LEFT, RIGHT)): "-",
+    frozenset((UP, RIGHT)): "L",
+    frozenset((UP, LEFT)): "J",
+    frozenset((DOWN, LEFT)): "7",
+    frozenset((DOWN, RIGHT)): "F",
+}
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    side = max(3, grid_side(BASE_SIDE, scale))
+    grid = [rng.choices("|-LJ7F.", k=side) for _ in range(side)]
+
+    top, bottom = column_region(side - 1, side - 1, rng)
+    path = corner_path(region_corners(top, bottom))
+    for i, point in enumerate(path):
+        before = direction(point, path[i - 1])
+        after = direction(point, path[(i + 1) % len(path)])
+        grid[point[0]][point[1]] = PIPES[frozenset((before, after))]
+
+    candidates = [point for point in path if grid[point[0]][point[1]] not in "L7"]
+    start = rng.choice(candidates)
+    on_loop = set(path)
+    for dr, dc in (UP, DOWN, LEFT, RIGHT):
+        r, c = start[0] + dr, start[1] + dc
+        if 0 <= r < side and 0 <= c < side and (r, c) not in on_loop:
+            grid[r][c] = "."
+    grid[start[0]][start[1]] = "S"
+    return join_lines(["".join(row) for row in grid])
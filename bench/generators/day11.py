@@ -0,0 +1,30 @@
+"""
+Day 11: a star map of galaxies, with some rows and columns left empty.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, grid_side, join_lines
+
+BASE_SIDE = 140
+GALAXY_DENSITY = 0.025
+EMPTY_FRACTION = 0.07
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    side = grid_side(BASE_SIDE, scale)
+    num_empty = round(side * EMPTY_FRACTION)
+    empty_rows = set(rng.sample(range(side), num_empty))
+    empty_cols = set(rng.sample(range(side), num_empty))
+    rows = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            galaxy = (
+                r not in empty_rows
+                and c not in empty_cols
+                and rng.random() < GALAXY_DENSITY
+            )
+            row.append("#" if galaxy else ".")
+        rows.append("".join(row))
+    return join_lines(rows)
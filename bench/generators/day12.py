@@ -0,0 +1,44 @@
+"""
+Day 12: spring rows and their damaged-group patterns.  Each row is built
+from a real arrangement, then some springs are hidden behind '?'.  Scale
+grows both the number of rows and their length.
+"""
+from random import Random
+import math
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_ROWS = 1000
+BASE_MIN_LENGTH = 8
+BASE_MAX_LENGTH = 20
+UNKNOWN_FRACTION = 0.45
+
+
+def make_row(min_length: int, max_length: int, rng: Random) -> str:
+    length = rng.randint(min_length, max_length)
+    springs = []
+    groups = []
+    while len(springs) < length:
+        springs += ["."] * rng.randint(0 if not springs else 1, 3)
+        size = rng.randint(1, 6)
+        if len(springs) + size > length:
+            break
+        springs += ["#"] * size
+        groups.append(size)
+    if not groups:
+        springs = ["#"]
+        groups = [1]
+    springs = springs[:length] + ["."] * (length - len(springs))
+    springs = [
+        "?" if rng.random() < UNKNOWN_FRACTION else spring
+        for spring in springs
+    ]
+    return "".join(springs) + " " + ",".join(map(str, groups))
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    stretch = math.sqrt(scale)
+    min_length = scaled(BASE_MIN_LENGTH, stretch)
+    max_length = max(min_length, scaled(BASE_MAX_LENGTH, stretch))
+    rows = [make_row(min_length, max_length, rng) for _ in range(scaled(BASE_ROWS, stretch))]
+    return join_lines(rows)
@@ -0,0 +1,74 @@
+"""
+Day 13: patterns of ash and rocks.  Each pattern has exactly one clean line
+of reflection, and exactly one other line that reflects once a single smudge
+is fixed.
+"""
+from random import Random
+from typing import List
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_PATTERNS = 100
+MIN_SIDE = 5
+MAX_SIDE = 17
+
+
+def transpose(rows: List[str]) -> List[str]:
+    return ["".join(col) for col in zip(*rows)]
+
+def line_diffs(rows: List[str]) -> List[int]:
+    """Return the number of mismatched cells for each horizontal line of reflection."""
+    diffs = []
+    for k in range(1, len(rows)):
+        count = 0
+        for i in range(min(k, len(rows) - k)):
+            count += sum(a != b for a, b in zip(rows[k - 1 - i], rows[k + i]))
+        diffs.append(count)
+    return diffs
+
+def is_valid(rows: List[str]) -> bool:
+    diffs = line_diffs(rows) + line_diffs(transpose(rows))
+    return diffs.count(0) == 1 and diffs.count(1) == 1
+
+def mirror_rows(rows: List[List[str]], k: int) -> None:
+    """Copy rows so the pattern reflects about the line above row k."""
+    for i in range(min(k, len(rows) - k)):
+        rows[k + i] = rows[k - 1 - i][:]
+
+def make_pattern(rng: Random) -> List[str]:
+    while True:
+        height = rng.randint(MIN_SIDE, MAX_SIDE)
+        width = rng.randint(MIN_SIDE, MAX_SIDE)
+        rows = [rng.choices("#.", k=width) for _ in range(height)]
+
+        # a clean horizontal line that leaves some rows outside its reach
+        clean = rng.choice([k for k in range(1, height) if 2 * k != height])
+        mirror_rows(rows, clean)
+
+        # a vertical line; mirroring columns keeps the rows' reflection intact
+        smudged = rng.randrange(1, width)
+        for row in rows:
+            for i in range(min(smudged, width - smudged)):
+                row[smudged + i] = row[smudged - 1 - i]
+
+        # add the smudge in a row the clean line doesn't reach
+        reach = min(clean, height - clean)
+        free_rows = range(0, clean - reach) if clean > height - clean else range(clean + reach, height)
+        r = rng.choice(free_rows)
+        c = rng.randrange(smudged - min(smudged, width - smudged), smudged)
+        rows[r][c] = "#" if rows[r][c] == "." else "."
+
+        pattern = ["".join(row) for row in rows]
+        if rng.random() < 0.5:
+            pattern = transpose(pattern)
+        if is_valid(pattern):
+            return pattern
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    lines = []
+    for i in range(scaled(BASE_PATTERNS, scale)):
+        if i:
+            lines.append("")
+        lines += make_pattern(rng)
+    return join_lines(lines)
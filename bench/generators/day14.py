@@ -0,0 +1,15 @@
+"""
+Day 14: a platform of round (O) and cube-shaped (#) rocks.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, grid_side, join_lines
+
+BASE_SIDE = 100
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    side = grid_side(BASE_SIDE, scale)
+    rows = ["".join(rng.choices(".O#", weights=(70, 18, 12), k=side)) for _ in range(side)]
+    return join_lines(rows)
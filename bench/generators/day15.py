@@ -0,0 +1,22 @@
+"""
+Day 15: one line of comma-separated lens steps.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, make_names, scaled
+
+BASE_STEPS = 4000
+BASE_LABELS = 500
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    labels = make_names(scaled(BASE_LABELS, scale), rng)
+    steps = []
+    for _ in range(scaled(BASE_STEPS, scale)):
+        label = rng.choice(labels)
+        if rng.random() < 0.4:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
@@ -0,0 +1,23 @@
+"""
+Day 16: a contraption of mirrors and splitters.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, grid_side, join_lines
+
+BASE_SIDE = 110
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    side = grid_side(BASE_SIDE, scale)
+    rows = [
+        "".join(rng.choices(".|-/\\", weights=(90, 2.5, 2.5, 2.5, 2.5), k=side))
+        for _ in range(side)
+    ]
+    # Part 1's beam enters at the top left heading right: clear its path
+    # along row 0 and turn it down into the grid halfway across, so it
+    # crosses the contraption at every scale instead of hitting a mirror
+    # in the first few tiles.
+    rows[0] = "." * (side // 2) + "\\" + "." * (side - side // 2 - 1)
+    return join_lines(rows)
@@ -0,0 +1,14 @@
+"""
+Day 17: a map of per-block heat loss.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, grid_side, join_lines
+
+BASE_SIDE = 141
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    side = grid_side(BASE_SIDE, scale)
+    return join_lines(["".join(rng.choices("123456789", k=side)) for _ in range(side)])
@@ -0,0 +1,71 @@
+"""
+Day 18: a dig plan.  The part 1 and part 2 (hex-coded) plans each trace the
+boundary of an independent random region, stretched so that the plans have
+small and large step sizes respectively.
+"""
+from random import Random
+from typing import List, Tuple
+
+from generators.common import (
+    DEFAULT_SEED, DOWN, LEFT, RIGHT, UP,
+    column_region, direction, join_lines, region_corners, scaled,
+)
+
+BASE_COLUMNS = 196
+MAX_HEX_STEPS = 0xFFFFF
+
+DIR_NAMES = {UP: "U", DOWN: "D", LEFT: "L", RIGHT: "R"}
+DIR_DIGITS = {RIGHT: 0, DOWN: 1, LEFT: 2, UP: 3}
+
+Step = Tuple[Tuple[int, int], int]
+
+
+def make_plan(columns: int, min_width: int, max_width: int, rng: Random) -> List[Step]:
+    """Trace a random region's boundary, with each lattice row and column
+    stretched to a random width.
+    """
+    rows = max(4, columns // 4)
+    top, bottom = column_region(columns, rows, rng)
+    corners = region_corners(top, bottom)
+
+    row_at = [0]
+    for _ in range(rows):
+        row_at.append(row_at[-1] + rng.randint(min_width, max_width))
+    col_at = [0]
+    for _ in range(columns):
+        col_at.append(col_at[-1] + rng.randint(min_width, max_width))
+
+    plan = []
+    for i, (r0, c0) in enumerate(corners):
+        r1, c1 = corners[(i + 1) % len(corners)]
+        steps = abs(row_at[r1] - row_at[r0]) + abs(col_at[c1] - col_at[c0])
+        plan.append((direction((r0, c0), (r1, c1)), steps))
+    return plan
+
+def split_steps(plan: List[Step], length: int, max_steps: int) -> List[Step]:
+    """Split moves (longest first) until the plan has the given length and
+    no move is longer than max_steps."""
+    plan = plan[:]
+    while True:
+        longest = max(range(len(plan)), key=lambda i: plan[i][1])
+        move, steps = plan[longest]
+        if steps <= max_steps and len(plan) >= length:
+            return plan
+        first = steps // 2
+        plan[longest:longest + 1] = [(move, first), (move, steps - first)]
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    columns = scaled(BASE_COLUMNS, scale)
+    plan1 = make_plan(columns, 2, 6, rng)
+    plan2 = make_plan(columns, 2_000, 60_000, rng)
+    length = max(len(plan1), len(plan2))
+    plan1 = split_steps(plan1, length, 99)
+    plan2 = split_steps(plan2, length, MAX_HEX_STEPS)
+    length = max(len(plan1), len(plan2))
+    plan1 = split_steps(plan1, length, 99)
+
+    lines = []
+    for (move1, steps1), (move2, steps2) in zip(plan1, plan2):
+        lines.append(f"{DIR_NAMES[move1]} {steps1} (#{steps2:05x}{DIR_DIGITS[move2]})")
+    return join_lines(lines)
@@ -0,0 +1,53 @@
+"""
+Day 19: a tree of workflows rooted at 'in', followed by a list of parts.
+Every workflow is referenced by exactly one rule, so the tree has no cycles;
+larger scales make it both wider and deeper.
+"""
+from random import Random
+from collections import deque
+
+from generators.common import DEFAULT_SEED, join_lines, make_names, scaled
+
+BASE_WORKFLOWS = 580
+BASE_PARTS = 200
+
+
+def make_rule(target: str, rng: Random) -> str:
+    category = rng.choice("xmas")
+    op = rng.choice("<>")
+    return f"{category}{op}{rng.randint(1, 4000)}:{target}"
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    num_workflows = scaled(BASE_WORKFLOWS, scale)
+    names = iter(make_names(num_workflows - 1, rng, exclude=["in"]))
+    remaining = num_workflows - 1
+
+    workflows = []
+    pending = deque(["in"])
+    while pending:
+        name = pending.popleft()
+        targets = []
+        for _ in range(rng.randint(2, 4)):
+            if remaining and rng.random() < 0.6:
+                target = next(names)
+                remaining -= 1
+                pending.append(target)
+            else:
+                target = rng.choice("AR")
+            targets.append(target)
+        if not pending and remaining:
+            # keep the tree growing until every workflow has been placed
+            target = next(names)
+            remaining -= 1
+            pending.append(target)
+            targets[-1] = target
+        rules = [make_rule(target, rng) for target in targets[:-1]]
+        workflows.append(f"{name}{{{','.join(rules + [targets[-1]])}}}")
+
+    rng.shuffle(workflows)
+    parts = []
+    for _ in range(scaled(BASE_PARTS, scale)):
+        x, m, a, s = (rng.randint(1, 4000) for _ in range(4))
+        parts.append(f"{{x={x},m={m},a={a},s={s}}}")
+    return join_lines(workflows + [""] + parts)
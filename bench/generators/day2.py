@@ -0,0 +1,26 @@
+"""
+Day 2: cube games, each showing every colour at least once.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_GAMES = 100
+
+COLORS = ("red", "green", "blue")
+
+
+def make_game(game_id: int, rng: Random) -> str:
+    draws = []
+    for _ in range(rng.randint(1, 6)):
+        colors = rng.sample(COLORS, rng.randint(1, len(COLORS)))
+        draws.append({color: rng.randint(1, 20) for color in colors})
+    for color in COLORS:
+        if not any(color in draw for draw in draws):
+            rng.choice(draws)[color] = rng.randint(1, 20)
+    hands = [", ".join(f"{n} {color}" for color, n in draw.items()) for draw in draws]
+    return f"Game {game_id}: " + "; ".join(hands)
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    return join_lines([make_game(i, rng) for i in range(1, scaled(BASE_GAMES, scale) + 1)])
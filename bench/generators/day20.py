@@ -0,0 +1,44 @@
+"""
+Day 20: a module configuration shaped like the real puzzle's.
+
+The broadcaster feeds a number of chains of flip-flops.  Each chain reports
+to a conjunction hub, which feeds back into the chain and into an inverter;
+the inverters all feed one conjunction that sends to rx.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, make_names, scaled
+
+BASE_CHAINS = 4
+CHAIN_LENGTH = 12
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    num_chains = scaled(BASE_CHAINS, scale)
+    names = iter(make_names(num_chains * (CHAIN_LENGTH + 2) + 1, rng,
+                            exclude=["rx", "broadcaster"]))
+    final = next(names)
+
+    lines = []
+    starts = []
+    for _ in range(num_chains):
+        chain = [next(names) for _ in range(CHAIN_LENGTH)]
+        hub = next(names)
+        inverter = next(names)
+        starts.append(chain[0])
+        hub_targets = [inverter]
+        for i, flip_flop in enumerate(chain):
+            targets = [chain[i + 1]] if i + 1 < len(chain) else []
+            if i == len(chain) - 1 or rng.random() < 0.5:
+                targets.append(hub)
+            else:
+                hub_targets.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(targets)}")
+        lines.append(f"&{hub} -> {', '.join(hub_targets)}")
+        lines.append(f"&{inverter} -> {final}")
+
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    lines.append(f"&{final} -> rx")
+    rng.shuffle(lines)
+    return join_lines(lines)
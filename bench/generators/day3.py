@@ -0,0 +1,34 @@
+"""
+Day 3: engine schematics of numbers and symbols.  The width stays at that
+of the real input; scale grows the number of rows.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_ROWS = 140
+WIDTH = 140
+
+SYMBOLS = "*#+$/@%=-&"
+
+
+def make_row(rng: Random) -> str:
+    row = []
+    while len(row) < WIDTH:
+        r = rng.random()
+        room = WIDTH - len(row)
+        if r < 0.1:
+            length = min(rng.randint(1, 3), room)
+            row += [rng.choice("123456789")] + rng.choices("0123456789", k=length - 1)
+            # keep the next number from running into this one
+            if len(row) < WIDTH:
+                row.append(rng.choice(SYMBOLS) if rng.random() < 0.1 else ".")
+        elif r < 0.14:
+            row.append("*" if rng.random() < 0.4 else rng.choice(SYMBOLS))
+        else:
+            row.append(".")
+    return "".join(row)
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    return join_lines([make_row(rng) for _ in range(scaled(BASE_ROWS, scale))])
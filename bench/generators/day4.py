@@ -0,0 +1,29 @@
+"""
+Day 4: scratchcards.  No card wins copies of cards past the end of the table.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_CARDS = 209
+NUM_WINNERS = 10
+NUM_HELD = 25
+NUMBERS = range(1, 100)
+
+
+def make_card(card_id: int, num_cards: int, width: int, rng: Random) -> str:
+    cards_left = num_cards - card_id
+    matches = min(rng.choice([0, 0, 0, 1, 1, 2, 3, 4, 5, 7, 10]), cards_left, NUM_WINNERS)
+    numbers = rng.sample(NUMBERS, NUM_WINNERS + NUM_HELD - matches)
+    winners = numbers[:NUM_WINNERS]
+    held = winners[:matches] + numbers[NUM_WINNERS:]
+    rng.shuffle(held)
+    winners_text = " ".join(f"{n:>2}" for n in winners)
+    held_text = " ".join(f"{n:>2}" for n in held)
+    return f"Card {card_id:>{width}}: {winners_text} | {held_text}"
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    num_cards = scaled(BASE_CARDS, scale)
+    width = len(str(num_cards))
+    return join_lines([make_card(i, num_cards, width, rng) for i in range(1, num_cards + 1)])
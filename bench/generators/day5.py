@@ -0,0 +1,49 @@
+"""
+Day 5: an almanac of seed ranges and seven range maps.  Each map cuts the
+32-bit number line into pieces and moves most of them to a shuffled layout.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_SEED_PAIRS = 10
+BASE_MAP_ENTRIES = 25
+LIMIT = 2**32
+
+MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+def make_map(num_entries: int, rng: Random) -> list:
+    cuts = sorted(rng.sample(range(1, LIMIT), num_entries))
+    pieces = list(zip([0] + cuts, cuts + [LIMIT]))
+    layout = pieces[:]
+    rng.shuffle(layout)
+    entries = []
+    dest = 0
+    for start, end in layout:
+        length = end - start
+        if rng.random() < 0.85:
+            entries.append(f"{dest} {start} {length}")
+        dest += length
+    rng.shuffle(entries)
+    return entries
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    seeds = []
+    for _ in range(scaled(BASE_SEED_PAIRS, scale)):
+        start = rng.randrange(LIMIT)
+        seeds += [start, rng.randint(1, min(LIMIT - start, 500_000_000))]
+    lines = ["seeds: " + " ".join(map(str, seeds))]
+    for name in MAP_NAMES:
+        lines += ["", f"{name} map:"]
+        lines += make_map(scaled(BASE_MAP_ENTRIES, scale), rng)
+    return join_lines(lines)
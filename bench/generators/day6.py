@@ -0,0 +1,24 @@
+"""
+Day 6: boat races.  Times are two digits and distances four, so the
+concatenated part 2 race is winnable too.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_RACES = 4
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    times = []
+    distances = []
+    for _ in range(scaled(BASE_RACES, scale)):
+        time = rng.randint(64, 99)
+        best = (time // 2) * (time - time // 2)
+        times.append(str(time))
+        distances.append(str(rng.randint(1000, best - 1)))
+    return join_lines([
+        "Time:     " + " ".join(t.rjust(6) for t in times),
+        "Distance: " + " ".join(d.rjust(6) for d in distances),
+    ])
@@ -0,0 +1,19 @@
+"""
+Day 7: camel card hands and bids.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_HANDS = 1000
+
+CARDS = "23456789TJQKA"
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    lines = []
+    for _ in range(scaled(BASE_HANDS, scale)):
+        hand = "".join(rng.choices(CARDS, k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return join_lines(lines)
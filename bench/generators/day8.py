@@ -0,0 +1,50 @@
+"""
+Day 8: a left/right instruction string and a node network.
+
+Each ghost starts at a node ending in A and walks a chain of node pairs
+(either instruction moves it one step along the chain) to its node ending
+in Z, which loops back to the start of the chain.  Ghost 0 walks from AAA
+to ZZZ.
+"""
+from random import Random
+import string
+
+from generators.common import DEFAULT_SEED, join_lines, make_names
+
+BASE_NODES = 800
+NUM_GHOSTS = 6
+NUM_INSTRUCTIONS = 263
+
+MIDDLE_LAST = string.ascii_uppercase[1:-1]
+
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    instructions = "".join(rng.choice("LR") for _ in range(NUM_INSTRUCTIONS))
+
+    nodes_per_ghost = max(4, round(BASE_NODES * scale / NUM_GHOSTS))
+    lengths = [rng.randint(nodes_per_ghost // 2 + 1, nodes_per_ghost // 2 + 1 + nodes_per_ghost // 4)
+               for _ in range(NUM_GHOSTS)]
+
+    ends = ["AAA"] + make_names(NUM_GHOSTS - 1, rng, string.ascii_uppercase, "A",
+                                min_length=3, exclude=["AAA", "ZZA"])
+    ends = [(start, start[:-1] + "Z") for start in ends]
+    ends[0] = ("AAA", "ZZZ")
+    middles = iter(make_names(2 * sum(lengths), rng, string.ascii_uppercase, MIDDLE_LAST,
+                              min_length=3))
+
+    network = {}
+    for (start, end), length in zip(ends, lengths):
+        pairs = [(next(middles), next(middles)) for _ in range(length - 1)]
+        network[start] = pairs[0]
+        for i, pair in enumerate(pairs):
+            following = pairs[i + 1] if i + 1 < len(pairs) else (end, end)
+            for node in pair:
+                network[node] = following
+        network[end] = pairs[0]
+
+    nodes = list(network.items())
+    rng.shuffle(nodes)
+    lines = [instructions, ""]
+    lines += [f"{node} = ({left}, {right})" for node, (left, right) in nodes]
+    return join_lines(lines)
@@ -0,0 +1,24 @@
+"""
+Day 9: sequences of polynomial values, built from random difference tables.
+"""
+from random import Random
+
+from generators.common import DEFAULT_SEED, join_lines, scaled
+
+BASE_LINES = 200
+LENGTH = 21
+
+
+def make_sequence(rng: Random) -> str:
+    degree = rng.randint(1, LENGTH - 2)
+    column = [rng.randint(-10, 25) for _ in range(degree + 1)]
+    values = [column[0]]
+    for _ in range(LENGTH - 1):
+        for level in range(degree):
+            column[level] += column[level + 1]
+        values.append(column[0])
+    return " ".join(map(str, values))
+
+def generate(scale: float = 1.0, seed: int = DEFAULT_SEED) -> str:
+    rng = Random(seed)
+    return join_lines([make_sequence(rng) for _ in range(scaled(BASE_LINES, scale))])
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Tabulate how the daily solutions scale with input size.
+
+For each requested day, synthetic inputs are generated at each scale (see
+generators/), and each part is run once against each of them.  Every run
+happens in its own child process with a timeout, so a solver that blows up
+at a large size doesn't stall the whole table; once a part times out or
+fails, its larger scales are skipped.
+
+The growth column is the empirical exponent k in time ~ size**k, measured
+against the previous scale.
+"""
+import sys
+from typing import List, Optional, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+import argparse
+import logging
+import math
+import multiprocessing
+import tempfile
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+import run
+import generators
+
+DEFAULT_SCALES = "1,10,100"
+DEFAULT_TIMEOUT = 60.0
+
+
+logging.basicConfig(format="%(message)s", stream=sys.stderr, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScalingResult:
+    """The outcome of running one part of one day against one generated input."""
+    day: int
+    part: int
+    scale: float
+    size: int
+    result: Optional[run.PartResult] = None
+    error: Optional[str] = None
+
+
+def _run_child(conn, day: int, part: int, infile: str) -> None:
+    try:
+        conn.send((run.run_part(day, part, infile), None))
+    except Exception as exc:
+        conn.send((None, f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+def run_with_timeout(day: int, part: int, infile: str, timeout: float):
+    """Run one part in a child process; return (PartResult, error message)."""
+    recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+    child = multiprocessing.Process(target=_run_child, args=(send_conn, day, part, infile))
+    child.start()
+    send_conn.close()
+    try:
+        if recv_conn.poll(timeout):
+            return recv_conn.recv()
+        return None, f"timeout after {timeout:g}s"
+    except EOFError:
+        return None, f"worker exited with code {child.exitcode}"
+    finally:
+        if child.is_alive():
+            child.terminate()
+        child.join()
+        recv_conn.close()
+
+def run_scaling(
+    days: Sequence[int],
+    parts: Sequence[int],
+    scales: Sequence[float],
+    outdir: Path,
+    timeout: float = DEFAULT_TIMEOUT,
+    seed: int = generators.DEFAULT_SEED,
+) -> List[ScalingResult]:
+    results = []
+    for day in days:
+        failed = set()
+        for scale in scales:
+            path = generators.write_input(day, outdir / f"day{day}_x{scale:g}.txt", scale, seed)
+            size = path.stat().st_size
+            for part in parts:
+                if part in failed:
+                    results.append(ScalingResult(day, part, scale, size, error="skipped"))
+                    continue
+                logger.debug(f"day {day} part {part} scale {scale:g}")
+                result, error = run_with_timeout(day, part, str(path), timeout)
+                if error:
+                    failed.add(part)
+                results.append(ScalingResult(day, part, scale, size, result, error))
+    return results
+
+
+# Output
+
+def format_table(results: Sequence[ScalingResult]) -> str:
+    header = ("day", "part", "scale", "size", "parse", "solve", "growth", "answer")
+    rows = [header]
+    previous = {}
+    for r in results:
+        key = (r.day, r.part)
+        growth = "-"
+        if r.result:
+            solve_time = r.result.solve_time
+            prev = previous.get(key)
+            if prev and prev[0] > 0 and solve_time > 0 and r.size != prev[1]:
+                growth = f"{math.log(solve_time / prev[0]) / math.log(r.size / prev[1]):.2f}"
+            previous[key] = (solve_time, r.size)
+            timings = (f"{r.result.parse_time * 1000:.2f}ms", f"{solve_time * 1000:.2f}ms")
+            answer = str(r.result.answer)
+        else:
+            timings = ("-", "-")
+            answer = r.error
+        rows.append((str(r.day), str(r.part), f"{r.scale:g}x", f"{r.size / 1024:.1f}K",
+                     *timings, growth, answer))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [cell.rjust(width) for cell, width in zip(row[:-1], widths)]
+        lines.append("  ".join(cells + [row[-1]]).rstrip())
+    return "\n".join(lines)
+
+
+# Command line
+
+def parse_scales(spec: str) -> List[float]:
+    try:
+        scales = [float(item) for item in spec.split(",") if item.strip()]
+    except ValueError:
+        raise run.UsageError(f"Unrecognized scale list '{spec}'")
+    if not scales or any(scale <= 0 for scale in scales):
+        raise run.UsageError(f"Unrecognized scale list '{spec}'")
+    return sorted(scales)
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Tabulate solver runtime against synthetic input size."
+    )
+    parser.add_argument(
+        "--days",
+        "-d",
+        help="The days to run, e.g. '1-5,7' (default: all with a generator)",
+    )
+    parser.add_argument(
+        "--parts",
+        "-p",
+        default="1,2",
+        help="The parts to run, e.g. '1' or '1,2' (default: both)",
+    )
+    parser.add_argument(
+        "--scales",
+        "-s",
+        default=DEFAULT_SCALES,
+        help=f"Input sizes relative to the real input (default: {DEFAULT_SCALES})",
+    )
+    parser.add_argument(
+        "--timeout",
+        "-t",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Seconds allowed per run (default: {DEFAULT_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=generators.DEFAULT_SEED,
+        help=f"Random seed for the generators (default: {generators.DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--outdir",
+        help="Keep the generated inputs in this directory (default: a temporary one)",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Produce debug output",
+    )
+    opt = parser.parse_args()
+
+    available = generators.available_days()
+    opt.days = run.parse_day_spec(opt.days) if opt.days else available
+    missing = [day for day in opt.days if day not in available]
+    if missing:
+        raise run.UsageError(f"No generator for day(s) {', '.join(map(str, missing))}")
+    opt.parts = run.parse_day_spec(opt.parts)
+    if not opt.parts or any(part not in run.PART_FUNCS for part in opt.parts):
+        raise run.UsageError("Unrecognized part list")
+    opt.scales = parse_scales(opt.scales)
+    return opt
+
+def main() -> int:
+    opt = parse_args()
+    if opt.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("[debug mode]")
+
+    if opt.outdir:
+        outdir = Path(opt.outdir)
+        outdir.mkdir(parents=True, exist_ok=True)
+        results = run_scaling(opt.days, opt.parts, opt.scales, outdir, opt.timeout, opt.seed)
+    else:
+        with tempfile.TemporaryDirectory(prefix="aoc-scaling-") as tmpdir:
+            results = run_scaling(opt.days, opt.parts, opt.scales, Path(tmpdir),
+                                  opt.timeout, opt.seed)
+    print(format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
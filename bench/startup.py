@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Audit the cold-start cost of the daily solutions.
+
+Each day module is imported in a fresh interpreter under `python -X importtime`,
+a few times over.  The table shows the wall time of the whole process, the
+time spent importing the day module itself (including everything it pulls
+in), and the heaviest of its direct imports.  Any day whose import time is
+over the budget is reported, and the script exits non-zero, so heavy
+dependencies (numpy and friends) stay out of module scope and are imported
+inside the functions that need them.
+"""
+import sys
+from typing import Dict, List, Sequence, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import logging
+import re
+import statistics
+import subprocess
+import time
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+import run
+
+DEFAULT_REPEAT = 5
+DEFAULT_BUDGET = 10.0
+DEFAULT_TOP = 3
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+logging.basicConfig(format="%(message)s", stream=sys.stderr, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupResult:
+    """The cold-start timings of one day module, in seconds."""
+    day: int
+    wall_time: float
+    import_time: float
+    heaviest: List[Tuple[str, float]] = field(default_factory=list)
+
+
+def parse_importtime(output: str, module: str) -> Tuple[float, Dict[str, float]]:
+    """Pick the module's cumulative import time out of -X importtime output.
+
+    Returns the time and the cumulative time of each of the module's direct
+    imports.  The output lists each module after the modules it imports, one
+    level of indentation deeper, so the direct imports are the lines just
+    above the module's own at exactly one level below it.
+    """
+    entries = []
+    for line in output.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            entries.append((len(m.group(3)) // 2, m.group(4), int(m.group(2)) / 1e6))
+    for i, (level, name, cumulative) in enumerate(entries):
+        if name == module:
+            children = {}
+            for child_level, child_name, child_time in reversed(entries[:i]):
+                if child_level <= level:
+                    break
+                if child_level == level + 1:
+                    children[child_name] = child_time
+            return cumulative, children
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+def measure_startup(day: int, path: Path) -> Tuple[float, float, Dict[str, float]]:
+    """Import one day module in a fresh interpreter; return (wall, import, children)."""
+    module = f"day{day}"
+    code = f"import sys; sys.path.insert(0, {str(path.parent)!r}); import {module}"
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+    return (wall_time, *parse_importtime(proc.stderr, module))
+
+def audit_day(day: int, path: Path, repeat: int = DEFAULT_REPEAT, top: int = DEFAULT_TOP) -> StartupResult:
+    """Measure a day's cold start `repeat` times and keep the medians."""
+    wall_times, import_times = [], []
+    children = {}
+    for _ in range(repeat):
+        wall_time, import_time, child_times = measure_startup(day, path)
+        wall_times.append(wall_time)
+        import_times.append(import_time)
+        for name, child_time in child_times.items():
+            children.setdefault(name, []).append(child_time)
+    heaviest = sorted(
+        ((name, statistics.median(times)) for name, times in children.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return StartupResult(
+        day,
+        statistics.median(wall_times),
+        statistics.median(import_times),
+        heaviest[:top],
+    )
+
+
+# Output
+
+def format_table(results: Sequence[StartupResult], budget: float) -> str:
+    header = ("day", "startup", "import", "heaviest imports")
+    rows = [header]
+    for r in results:
+        heaviest = ", ".join(f"{name} {t * 1000:.1f}ms" for name, t in r.heaviest)
+        flag = "  OVER BUDGET" if r.import_time * 1000 > budget else ""
+        rows.append((str(r.day), f"{r.wall_time * 1000:.1f}ms",
+                     f"{r.import_time * 1000:.1f}ms", heaviest + flag))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [cell.rjust(width) for cell, width in zip(row[:-1], widths)]
+        lines.append("  ".join(cells + [row[-1]]).rstrip())
+    return "\n".join(lines)
+
+
+# Command line
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Measure the cold-start import time of each day's module."
+    )
+    parser.add_argument(
+        "--days",
+        "-d",
+        help="The days to audit, e.g. '1-5,7' (default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Fresh interpreters per day; the median is reported (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--budget",
+        "-b",
+        type=float,
+        default=DEFAULT_BUDGET,
+        help=f"Milliseconds allowed for importing a day module (default: {DEFAULT_BUDGET:g})",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help=f"How many of the heaviest imports to show (default: {DEFAULT_TOP})",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Produce debug output",
+    )
+    opt = parser.parse_args()
+
+    available = run.find_days()
+    opt.days = run.parse_day_spec(opt.days) if opt.days else list(available)
+    missing = [day for day in opt.days if day not in available]
+    if missing:
+        raise run.UsageError(f"No module for day(s) {', '.join(map(str, missing))}")
+    if opt.repeat < 1:
+        raise run.UsageError("--repeat must be at least 1")
+    opt.paths = available
+    return opt
+
+def main() -> int:
+    opt = parse_args()
+    if opt.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("[debug mode]")
+
+    results = []
+    for day in opt.days:
+        logger.debug(f"day {day}: {opt.paths[day]}")
+        results.append(audit_day(day, opt.paths[day], opt.repeat, opt.top))
+    print(format_table(results, opt.budget))
+
+    over = [r for r in results if r.import_time * 1000 > opt.budget]
+    for r in over:
+        logger.error(f"OVER BUDGET day {r.day}: import took {r.import_time * 1000:.1f}ms "
+                     f"(budget {opt.budget:g}ms)")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
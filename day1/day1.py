@@ -2,14 +2,16 @@
 #
 #  Advent of Code 2023 - Day 1
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
-import math
-import re
+from collections import deque
+from itertools import repeat
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, line_chunks, load_input, load_text, map_bytes
 
 INPUTFILE = "input.txt"
+CHUNK_SIZE = 1 << 23
 
 SAMPLE_CASES = [
     (
@@ -35,8 +37,14 @@ SAMPLE_CASES2 = [
     7pqrstsixteen
     """,
     281
-    )
-
+    ),
+    (
+    """
+    t09n05xar
+    0one
+    """,
+    6
+    ),
 ]
 
 WORD_TO_DIGIT = {
@@ -52,61 +60,76 @@ WORD_TO_DIGIT = {
 }
 
 
+# Solution
+def build_automaton(patterns):
+    """Compile patterns (text -> digit) into an Aho-Corasick automaton.
+
+    Returns (transitions, outputs).  transitions[state] maps a character to
+    the next state, with the failure links already folded in, so a scan is
+    one dict lookup per character; any character not listed goes back to
+    state 0.  outputs[state] is the digit of the pattern that ends in that
+    state, or None.  None of the patterns is a suffix of another, so a state
+    never has more than one.
+    """
+    goto = [{}]
+    outputs = [None]
+    for text, digit in patterns.items():
+        state = 0
+        for char in text:
+            if char not in goto[state]:
+                goto[state][char] = len(goto)
+                goto.append({})
+                outputs.append(None)
+            state = goto[state][char]
+        outputs[state] = digit
+
+    transitions = [dict(goto[0])] + [None] * (len(goto) - 1)
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        transitions[state] = {**transitions[fail[state]], **goto[state]}
+        if outputs[state] is None:
+            outputs[state] = outputs[fail[state]]
+        for char, target in goto[state].items():
+            if state:
+                fail[target] = transitions[fail[state]].get(char, 0)
+            queue.append(target)
+    return transitions, outputs
+
+DIGIT_PATTERNS = {**WORD_TO_DIGIT, **{digit: digit for digit in "0123456789"}}
+FORWARD = build_automaton(DIGIT_PATTERNS)
+BACKWARD = build_automaton({text[::-1]: digit for text, digit in DIGIT_PATTERNS.items()})
+
+def scan_digits(chars, automaton=FORWARD):
+    """Yield every digit, spelled or not, in order, including overlapping ones."""
+    transitions, outputs = automaton
+    state = 0
+    for char in chars:
+        state = transitions[state].get(char, 0)
+        digit = outputs[state]
+        if digit is not None:
+            yield digit
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
+def parse_digits(line):
+    return "".join(scan_digits(line))
 
+def calibration_value(line):
+    """Combine the first and last digits of a line.
 
-# Solution
-def parse_digits(line):
-    digits = ""
-    for i in range(len(line)):
-        char = line[i]
-        if char.isdigit():
-            digits += char
-        else:
-            for word in WORD_TO_DIGIT.keys():
-                if line[i:].startswith(word):
-                    digits += WORD_TO_DIGIT[word]
-
-    return digits
+    The first digit is found scanning forwards and the last scanning the
+    reversed line with the reversed patterns, each stopping at its first
+    match, so a long line is only read up to its outermost digits.
+    """
+    first = next(scan_digits(line, FORWARD), None)
+    if first is None:
+        raise ValueError(f"No digits in line '{line}'")
+    last = next(scan_digits(reversed(line), BACKWARD))
+    return int(first + last)
 
 def solve2(lines: Lines) -> int:
     """Solve the problem."""
-    nums = []
-    for line in lines:
-        digits = parse_digits(line)
-        line_num = int(digits[0] + digits[-1])
-        nums.append(line_num)
-    return sum(nums)
+    return sum(calibration_value(line) for line in lines)
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
@@ -117,6 +140,47 @@ def solve(lines: Lines) -> int:
         nums.append(line_num)
     return sum(nums)
 
+# Streaming
+NON_DIGITS = bytes(c for c in range(256) if not ord("0") <= c <= ord("9"))
+
+def sum_chunk(data: bytes, spelled=False) -> int:
+    """Sum the calibration values of a run of whole lines."""
+    total = 0
+    for line in data.split(b"\n"):
+        if line.isspace() or not line:
+            continue
+        if spelled:
+            total += calibration_value(line.decode())
+            continue
+        digits = line.translate(None, NON_DIGITS)
+        if not digits:
+            raise ValueError(f"No digits in line '{line.decode()}'")
+        total += (digits[0] - 48) * 10 + digits[-1] - 48
+    return total
+
+def sum_file_range(infile, start: int, end: int, spelled=False) -> int:
+    with map_bytes(infile) as view:
+        return sum_chunk(bytes(view[start:end]), spelled)
+
+def stream_solve(infile, spelled=False, chunk_size=CHUNK_SIZE, workers=1) -> int:
+    """Sum the calibration values of a file without loading it.
+
+    The file is memory-mapped and cut into chunks of whole lines, about
+    chunk_size bytes each, so only one chunk per worker is ever copied out
+    of the map.  With workers > 1, the chunks are summed in a process pool;
+    each worker maps the file for itself.  spelled selects the part-2 rules.
+    """
+    with map_bytes(infile) as view:
+        if workers <= 1:
+            return sum(sum_chunk(bytes(view[start:end]), spelled)
+                       for start, end in line_chunks(view, chunk_size))
+        ranges = list(line_chunks(view, chunk_size))
+    from concurrent.futures import ProcessPoolExecutor
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(sum_file_range, repeat(str(infile)), starts, ends, repeat(spelled)))
+
 # PART 1
 
 def example1() -> None:
@@ -127,6 +191,7 @@ def example1() -> None:
         result = solve(lines)
         print(f"'{text}' -> {result} (expected {expected})")
         assert result == expected
+        assert sum_chunk("\n".join(lines).encode()) == expected
     print("= " * 32)
 
 def part1(lines: Lines) -> None:
@@ -134,6 +199,7 @@ def part1(lines: Lines) -> None:
     result = solve(lines)
     print(f"result is {result}")
     assert result == 54968
+    assert stream_solve(INPUTFILE) == result
     print("= " * 32)
 
 
@@ -147,6 +213,7 @@ def example2() -> None:
         result = solve2(lines)
         print(f"'{text}' -> {result} (expected {expected})")
         assert result == expected
+        assert sum_chunk("\n".join(lines).encode(), spelled=True) == expected
     print("= " * 32)
 
 def part2(lines: Lines) -> None:
@@ -154,6 +221,7 @@ def part2(lines: Lines) -> None:
     result = solve2(lines)
     print(f"result is {result}")
     assert result == 54094
+    assert stream_solve(INPUTFILE, spelled=True) == result
     print("= " * 32)
 
 
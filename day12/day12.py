@@ -1,14 +1,13 @@
 #!/usr/bin/env python3
 #
 #  Advent of Code 2023 - Day 12 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
 from functools import cache
 
-import math
-import re
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
 
 INPUTFILE = "input.txt"
 
@@ -42,38 +41,6 @@ SAMPLE_CASES2 = [
 ]
 
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
-
 # Solution
 def parse_lines(lines):
     springs = []
@@ -2,12 +2,12 @@
 #
 #  Advent of Code 2023 - Day 13
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
-import math
-import re
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, parse_sections
+import aoclib
 
 INPUTFILE = "input.txt"
 
@@ -57,36 +57,13 @@ SAMPLE_CASES2 = [
     ),
 ]
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
 # Utility functions
 
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
+def load_input(infile: str, strip=True, blank_lines=True) -> Lines:
+    return aoclib.load_input(infile, strip, blank_lines)
 
 def load_text(text: str, strip=True, blank_lines=True) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
+    return aoclib.load_text(text, strip, blank_lines)
 
 def is_one_off(row1, row2):
     num_diff = 0
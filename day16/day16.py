@@ -2,14 +2,12 @@
 #
 #  Advent of Code 2023 - Day 16
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
 from copy import deepcopy
-import numpy as np
-import math
-import re
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
 
 INPUTFILE = "input.txt"
 
@@ -50,37 +48,6 @@ SAMPLE_CASES2 = [
 ]
 
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
 RIGHT = (0, 1)
 LEFT  = (0, -1)
 UP    = (-1, 0)
@@ -97,6 +64,9 @@ def gen_start_moves(grid):
         starting_moves.append(((i, len(grid[0]) - 1), LEFT))
     return starting_moves
 
+def add(pos, move):
+    return (pos[0] + move[0], pos[1] + move[1])
+
 def in_bounds(pos, grid):
     row_bounds = (0, len(grid))
     col_bounds = (0, len(grid[0]))
@@ -108,39 +78,39 @@ def in_bounds(pos, grid):
 
 def get_moves(pos, char, direction):
     if char == '.':
-        return [(tuple(np.add(pos, direction)), direction)]
+        return [(add(pos, direction), direction)]
     
     if char == '|':
         if direction in [LEFT, RIGHT]:
-            return [(tuple(np.add(pos, UP)), UP), (tuple(np.add(pos, DOWN)), DOWN)]
+            return [(add(pos, UP), UP), (add(pos, DOWN), DOWN)]
         else:
-            return [(tuple(np.add(pos, direction)), direction)]
+            return [(add(pos, direction), direction)]
 
     if char == '-':
         if direction in [UP, DOWN]:
-            return [(tuple(np.add(pos, LEFT)), LEFT), (tuple(np.add(pos, RIGHT)), RIGHT)]
+            return [(add(pos, LEFT), LEFT), (add(pos, RIGHT), RIGHT)]
         else:
-            return [(tuple(np.add(pos, direction)), direction)]
+            return [(add(pos, direction), direction)]
 
     if char == '/':
         if direction == LEFT:
-            return [(tuple(np.add(pos, DOWN)), DOWN)]
+            return [(add(pos, DOWN), DOWN)]
         if direction == RIGHT:
-            return [(tuple(np.add(pos, UP)), UP)]
+            return [(add(pos, UP), UP)]
         if direction == UP:
-            return [(tuple(np.add(pos, RIGHT)), RIGHT)]
+            return [(add(pos, RIGHT), RIGHT)]
         if direction == DOWN:
-            return [(tuple(np.add(pos, LEFT)), LEFT)]
+            return [(add(pos, LEFT), LEFT)]
 
     if char == "\\":
         if direction == LEFT:
-            return [(tuple(np.add(pos, UP)), UP)]
+            return [(add(pos, UP), UP)]
         if direction == RIGHT:
-            return [(tuple(np.add(pos, DOWN)), DOWN)]
+            return [(add(pos, DOWN), DOWN)]
         if direction == UP:
-            return [(tuple(np.add(pos, LEFT)), LEFT)]
+            return [(add(pos, LEFT), LEFT)]
         if direction == DOWN:
-            return [(tuple(np.add(pos, RIGHT)), RIGHT)]
+            return [(add(pos, RIGHT), RIGHT)]
 
 def follow_beam(starting_move, grid, debug=False):
     beams = [starting_move]
@@ -2,14 +2,12 @@
 #
 #  Advent of Code 2023 - Day 17
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
 import heapq
-import math
-import re
-import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
 
 INPUTFILE = "input.txt"
 
@@ -65,36 +63,6 @@ SAMPLE_CASES2 = [
     )
 ]
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
 
 RIGHT = (0, 1)
 LEFT  = (0, -1)
@@ -110,6 +78,9 @@ def parse_lines(lines):
         grid.append(line)
     return grid
 
+def add(pos, move):
+    return (pos[0] + move[0], pos[1] + move[1])
+
 def in_bounds(pos, grid):
     row_bounds = (0, len(grid))
     col_bounds = (0, len(grid[0]))
@@ -155,7 +126,7 @@ def traverse(grid, debug=False):
                 moves = [LEFT, RIGHT, DOWN]
 
         for move in moves:
-            next_pos = tuple(np.add(pos, move))
+            next_pos = add(pos, move)
 
             if in_bounds(next_pos, grid):
                 new_score = score + grid[next_pos[0]][next_pos[1]]
@@ -229,7 +200,7 @@ def traverse2(grid, debug=False):
                 moves = [LEFT, RIGHT, DOWN]
 
         for move in moves:
-            next_pos = tuple(np.add(pos, move))
+            next_pos = add(pos, move)
 
             if in_bounds(next_pos, grid):
                 new_score = score + grid[next_pos[0]][next_pos[1]]
@@ -2,15 +2,20 @@
 #
 #  Advent of Code 2023 - Day 2
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
-import math
 import re
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
+
 INPUTFILE = "input.txt"
 
+COLORS = ("red", "green", "blue")
+BAG_LIMITS = (12, 13, 14)
+TOKEN_RE = re.compile(r"Game (\d+)|(\d+) (red|green|blue)")
+QUERY_BLOCK = 1 << 22
+
 SAMPLE_CASES = [
     (
         """
@@ -36,91 +41,120 @@ SAMPLE_CASES2 = [
     ),
 ]
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
 
 # Solution
-def parse_games(game):
-    max_colors = {}
-    for hand in game.split(";"):
-        for color in hand.split(", "):
-            number = int(color.strip().split(" ")[0])
-            pebble = None
-            if "blue" in color:
-                pebble = "blue"
-            if "red" in color:
-                pebble = "red"
-            if "green" in color:
-                pebble = "green"
-            
-            max_pebbles = max_colors.get(pebble)
-            if max_pebbles:
-                if max_pebbles < number:
-                    max_colors[pebble] = number
-            else:
-                max_colors[pebble] = number
-    return max_colors
+def parse_game_table(lines: Lines):
+    """Tokenize the game log into a column per color.
+
+    Returns (ids, counts): ids[i] is the number of the i-th game, and
+    counts[i, c] the most cubes of COLORS[c] shown at once in that game.
+    The whole log goes through one regex, and the maxima are taken by
+    numpy, not by a Python loop per hand.
+    """
+    import numpy as np
+
+    ids = []
+    rows, cols, values = [], [], []
+    color_index = {color: i for i, color in enumerate(COLORS)}
+    for game, number, color in TOKEN_RE.findall("\n".join(lines)):
+        if game:
+            ids.append(int(game))
+        else:
+            rows.append(len(ids) - 1)
+            cols.append(color_index[color])
+            values.append(int(number))
+    counts = np.zeros((len(ids), len(COLORS)), dtype=np.int32)
+    np.maximum.at(counts, (rows, cols), values)
+    return np.array(ids, dtype=np.int64), counts
+
+def game_powers(counts):
+    """The power of each game: the product of its color maxima."""
+    import numpy as np
+
+    return counts.astype(np.int64).prod(axis=1)
+
+def query_limits(ids, counts, limits):
+    """Check many bag configurations against the game table at once.
+
+    limits is a (k x len(COLORS)) array of cube counts, one bag per row.
+    Returns (id_sums, power_sums): for each bag, the sum of the ids and of
+    the powers of the games it could have played.  The bags are compared
+    with every game by broadcasting, a block of bags at a time so the
+    comparison array stays under QUERY_BLOCK cells.
+    """
+    import numpy as np
+
+    limits = np.asarray(limits, dtype=np.int32).reshape(-1, len(COLORS))
+    weights = np.stack([ids, game_powers(counts)], axis=1)
+    sums = np.empty((len(limits), 2), dtype=np.int64)
+    block = max(1, QUERY_BLOCK // max(1, counts.size))
+    for start in range(0, len(limits), block):
+        bags = limits[start:start + block]
+        feasible = (counts[np.newaxis, :, :] <= bags[:, np.newaxis, :]).all(axis=2)
+        sums[start:start + block] = feasible.astype(np.int64) @ weights
+    return sums[:, 0], sums[:, 1]
+
+class GameTally:
+    """Running part 1 and part 2 totals over a stream of game records.
+
+    Each record is scored as it arrives and then forgotten, so memory stays
+    at one count per color however long the stream runs; id_sum and
+    power_sum can be read at any point.
+    """
+
+    def __init__(self, limits=BAG_LIMITS):
+        self.limits = tuple(limits)
+        self.games = 0
+        self.id_sum = 0
+        self.power_sum = 0
+
+    def add(self, record: str) -> None:
+        """Score one "Game N: ..." line; blank lines are ignored."""
+        maxima = [0] * len(COLORS)
+        game = None
+        for game_id, number, color in TOKEN_RE.findall(record):
+            if game_id:
+                game = int(game_id)
+                continue
+            i = COLORS.index(color)
+            maxima[i] = max(maxima[i], int(number))
+        if game is None:
+            if record.strip():
+                raise ValueError(f"Not a game record: '{record.strip()}'")
+            return
+        self.games += 1
+        if all(count <= limit for count, limit in zip(maxima, self.limits)):
+            self.id_sum += game
+        power = 1
+        for count in maxima:
+            power *= count
+        self.power_sum += power
+
+    def feed(self, records) -> "GameTally":
+        """Score every record from an iterable, e.g. an open file."""
+        for record in records:
+            self.add(record)
+        return self
+
+def stream_totals(records, limits=BAG_LIMITS):
+    """Yield (id_sum, power_sum) after each game in the stream."""
+    tally = GameTally(limits)
+    for record in records:
+        games = tally.games
+        tally.add(record)
+        if tally.games > games:
+            yield tally.id_sum, tally.power_sum
 
 def solve2(lines: Lines) -> int:
     """Solve the problem."""
-    game_to_colors = {}
-    power = 0
-    for line in lines:
-        split_lines = line.split(":")
-        game_id = int(split_lines[0].split(" ")[-1])
-        colors = parse_games(split_lines[1])
-        game_to_colors[game_id] = colors
-        power += colors["green"] * colors["red"] * colors["blue"]
-    return power
+    _, counts = parse_game_table(lines)
+    return int(game_powers(counts).sum())
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
-    game_to_colors = {}
-    for line in lines:
-        split_lines = line.split(":")
-        game_id = int(split_lines[0].split(" ")[-1])
-        colors = parse_games(split_lines[1])
-        game_to_colors[game_id] = colors
-
-    sum_ids = 0
-    for game in game_to_colors.keys():
-        if game_to_colors[game]["red"] > 12:
-            continue
-        if game_to_colors[game]["green"] > 13:
-            continue
-        if game_to_colors[game]["blue"] > 14:
-            continue
-        sum_ids += game
-    return sum_ids
+    ids, counts = parse_game_table(lines)
+    id_sums, _ = query_limits(ids, counts, [BAG_LIMITS])
+    return int(id_sums[0])
 
 
 # PART 1
@@ -133,6 +167,7 @@ def example1() -> None:
         result = solve(lines)
         print(f"'{text}' -> {result} (expected {expected})")
         assert result == expected
+        assert GameTally().feed(lines).id_sum == expected
     print("= " * 32)
 
 def part1(lines: Lines) -> None:
@@ -140,6 +175,8 @@ def part1(lines: Lines) -> None:
     result = solve(lines)
     print(f"result is {result}")
     assert result == 2237
+    with open(INPUTFILE) as fp:
+        assert GameTally().feed(fp).id_sum == result
     print("= " * 32)
 
 
@@ -153,6 +190,7 @@ def example2() -> None:
         result = solve2(lines)
         print(f"'{text}' -> {result} (expected {expected})")
         assert result == expected
+        assert GameTally().feed(lines).power_sum == expected
     print("= " * 32)
 
 def part2(lines: Lines) -> None:
@@ -160,6 +198,7 @@ def part2(lines: Lines) -> None:
     result = solve2(lines)
     print(f"result is {result}")
     assert result == 66681
+    assert list(stream_totals(lines))[-1] == (solve(lines), result)
     print("= " * 32)
 
 
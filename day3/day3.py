@@ -2,15 +2,20 @@
 #
 #  Advent of Code 2023 - Day 3
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
-import math
+from bisect import bisect_right
 import re
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
+
 INPUTFILE = "input.txt"
 
+NUMBER_RE = re.compile(r"\d+")
+SYMBOL_RE = re.compile(r"[^\d.]")
+MAX_DIGITS = 18
+
 SAMPLE_CASES = [
     (
         """
@@ -47,114 +52,141 @@ SAMPLE_CASES2 = [
     ),
 ]
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
 
 # Solution
-def parse_numbers(lines):
-    numbers = []
-    for i in range(len(lines)):
-        line = lines[i].strip()
-
-        j = 0
-        while j < len(line):
-            curr_num = None
-            start = 0
-            length = 0
-    
-            char = line[j]
-            while char.isdigit():
-                if not curr_num:
-                    curr_num = char
-                    start = j
-                    length = 1
-                else:
-                    curr_num += char
-                    length += 1
-                j += 1
-                if j >= len(line):
-                    break
-                char = line[j]
-    
-            if curr_num:
-                char_length = len(curr_num)
-                numbers.append((int(curr_num), i, start, start + length - 1))            
-            
-            j += 1 
-    
-    return numbers
-
-def get_neighbor_coords(x, y_0, y_1, row_bound, col_bound):
-    coords = []
-    if (x - 1) >= 0:
-        for i in range(max(0, y_0 - 1), min(col_bound, y_1 + 1 + 1)):
-            coords.append((x-1, i))
-    if (y_0 - 1) >= 0:
-        coords.append((x, y_0 -1))
-    if (y_1 + 1) < col_bound:
-        coords.append((x, y_1 + 1))
-    if (x + 1) < row_bound:
-        for i in range(max(0, y_0 - 1), min(col_bound, y_1 + 1 + 1)):
-            coords.append((x+1, i))
-    return coords 
-    
-def is_symbol(char):
-    return char != '.' and not char.isdigit()
+def load_schematic(lines: Lines):
+    """The schematic as a (rows x cols) uint8 array of character codes."""
+    import numpy as np
+
+    widths = {len(line) for line in lines}
+    if len(widths) != 1:
+        raise ValueError(f"Schematic rows have different widths: {sorted(widths)}")
+    return np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+
+def neighborhood(padded, rows, cols):
+    """The 3x3 neighborhoods of a padded array, as 9 shifted views."""
+    return [padded[dr:dr + rows, dc:dc + cols] for dr in range(3) for dc in range(3)]
+
+def label_numbers(grid):
+    """Label each run of digits in the schematic.
+
+    Returns (labels, values): labels[r, c] is the 1-based index of the number
+    the cell belongs to (0 for other cells), and values[k] is the value of
+    number k (values[0] is 0).  Runs never continue onto the next row.
+    """
+    import numpy as np
+
+    rows, cols = grid.shape
+    digits = (grid >= ord("0")) & (grid <= ord("9"))
+    # A blank column at the end of each row stops runs wrapping around.
+    is_digit = np.zeros((rows, cols + 1), dtype=bool)
+    is_digit[:, :cols] = digits
+    flat = is_digit.ravel()
+    starts = flat & ~np.concatenate(([False], flat[:-1]))
+    labels = np.cumsum(starts) * flat
+
+    # Each digit's place value counts back from the last digit of its run.
+    # The sums stay in int64, so a run must fit in one.
+    ends = np.flatnonzero(flat & ~np.concatenate((flat[1:], [False])))
+    place = ends[labels[flat] - 1] - np.flatnonzero(flat)
+    if place.size and place.max() >= MAX_DIGITS:
+        raise ValueError(f"Schematic numbers are limited to {MAX_DIGITS} digits")
+    digit = grid[digits].astype(np.int64) - ord("0")
+    values = np.zeros(len(ends) + 1, dtype=np.int64)
+    if len(ends):
+        run_starts = np.flatnonzero(starts[flat])
+        values[1:] = np.add.reduceat(digit * 10 ** place, run_starts)
+    return labels.reshape(rows, cols + 1)[:, :cols], values
 
 def solve2(lines: Lines) -> int:
     """Solve the problem."""
-    numbers = parse_numbers(lines)
-    sum_res = 0
-    symbol_neighbors = defaultdict(list)
-    for number, x, y_start, y_end in numbers:
-        coords = get_neighbor_coords(x, y_start, y_end, len(lines), len(lines[0]))
-        for coord in coords:
-            symbol_neighbors[coord].append(number)
-    
-    for (x,y), nums in symbol_neighbors.items():
-        if len(nums) == 2 and lines[x][y] == '*':
-            sum_res += nums[0] * nums[1]
-    return sum_res
+    import numpy as np
+
+    grid = load_schematic(lines)
+    labels, values = label_numbers(grid)
+    padded = np.pad(labels, 1)
+    star_rows, star_cols = np.nonzero(grid == ord("*"))
+    # The labels around each gear, sorted so repeats of a number are adjacent.
+    around = np.sort(np.stack([padded[star_rows + dr, star_cols + dc]
+                               for dr in range(3) for dc in range(3)], axis=1), axis=1)
+    first = (around != np.pad(around, ((0, 0), (1, 0)))[:, :-1]) & (around != 0)
+    gears = first.sum(axis=1) == 2
+    pairs = around[gears][first[gears]].reshape(-1, 2)
+    # Python ints, so large ratios can't overflow.
+    return sum(a * b for a, b in zip(values[pairs[:, 0]].tolist(), values[pairs[:, 1]].tolist()))
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
-    numbers = parse_numbers(lines)
-    sum_res = 0
-    for number, x, y_start, y_end in numbers:
-        coords = get_neighbor_coords(x, y_start, y_end, len(lines), len(lines[0]))
-        for x,y in coords:
-            if is_symbol(lines[x][y]):
-                sum_res += number
-    return sum_res
-
+    import numpy as np
+
+    grid = load_schematic(lines)
+    rows, cols = grid.shape
+    labels, values = label_numbers(grid)
+    is_symbol = (grid != ord(".")) & ((grid < ord("0")) | (grid > ord("9")))
+    near_symbol = np.logical_or.reduce(neighborhood(np.pad(is_symbol, 1), rows, cols))
+    touching = np.unique(labels[near_symbol & (labels > 0)])
+    return sum(values[touching].tolist())
+
+
+# Streaming
+class Row:
+    """One schematic row, with the spans of its numbers."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.numbers = [(m.start(), m.end(), int(m.group())) for m in NUMBER_RE.finditer(text)]
+        self.starts = [start for start, _, _ in self.numbers]
+
+    def has_symbol(self, start: int, end: int) -> bool:
+        return SYMBOL_RE.search(self.text, max(0, start), end) is not None
+
+    def numbers_near(self, col: int):
+        """The values of the numbers touching column col (at most two)."""
+        i = bisect_right(self.starts, col + 1)
+        return [value for start, end, value in self.numbers[max(0, i - 2):i] if end >= col]
+
+def score_row(prev, row, nxt):
+    """The part number sum and gear ratio sum of the middle row of three."""
+    window = [r for r in (prev, row, nxt) if r is not None]
+    parts = 0
+    for start, end, value in row.numbers:
+        if any(r.has_symbol(start - 1, end + 1) for r in window):
+            parts += value
+    gears = 0
+    col = row.text.find("*")
+    while col >= 0:
+        near = [value for r in window for value in r.numbers_near(col)]
+        if len(near) == 2:
+            gears += near[0] * near[1]
+        col = row.text.find("*", col + 1)
+    return parts, gears
+
+def stream_rows(lines):
+    """Yield (part sum, gear sum) for each row of a schematic as it streams by.
+
+    lines can be any iterable, e.g. an open file.  Only the previous,
+    current and next rows are kept, so memory is O(width) however many rows
+    there are.
+    """
+    prev = row = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        nxt = Row(line)
+        if row is not None:
+            yield score_row(prev, row, nxt)
+        prev, row = row, nxt
+    if row is not None:
+        yield score_row(prev, row, None)
+
+def stream_solve(lines):
+    """Return the (part 1, part 2) answers for a streamed schematic."""
+    parts = gears = 0
+    for row_parts, row_gears in stream_rows(lines):
+        parts += row_parts
+        gears += row_gears
+    return parts, gears
 
 # PART 1
 
@@ -166,6 +198,7 @@ def example1() -> None:
         result = solve(lines)
         print(f"'{text}' -> {result} (expected {expected})")
         assert result == expected
+        assert stream_solve(lines)[0] == expected
     print("= " * 32)
 
 def part1(lines: Lines) -> None:
@@ -173,6 +206,8 @@ def part1(lines: Lines) -> None:
     result = solve(lines)
     print(f"result is {result}")
     assert result == 530849
+    with open(INPUTFILE) as fp:
+        assert stream_solve(fp)[0] == result
     print("= " * 32)
 
 
@@ -186,6 +221,7 @@ def example2() -> None:
         result = solve2(lines)
         print(f"'{text}' -> {result} (expected {expected})")
         assert result == expected
+        assert stream_solve(lines)[1] == expected
     print("= " * 32)
 
 def part2(lines: Lines) -> None:
@@ -193,6 +229,8 @@ def part2(lines: Lines) -> None:
     result = solve2(lines)
     print(f"result is {result}")
     assert result == 84900879
+    with open(INPUTFILE) as fp:
+        assert stream_solve(fp)[1] == result
     print("= " * 32)
 
 
@@ -2,14 +2,14 @@
 #
 #  Advent of Code 2023 - Day 4
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
-import math
-import re
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_bytes, load_input, load_text
 
 INPUTFILE = "input.txt"
+FIELD_WIDTH = 2
 
 SAMPLE_CASES = [
     (
@@ -23,6 +23,22 @@ SAMPLE_CASES = [
         """,
         13
     ),
+    (
+        # Same-length lines without the fixed column layout
+        """
+        Card 1: 1 22 | 1 22
+        Card 2: 3 44 | 3 44
+        """,
+        4
+    ),
+    (
+        # Blank fields in both halves must not match each other
+        """
+        Card 1:  1     2 |  3     4
+        Card 2:  5  6  7 |  8  9 10
+        """,
+        0
+    ),
 ]
 
 SAMPLE_CASES2 = [
@@ -37,41 +53,25 @@ SAMPLE_CASES2 = [
         """,
         30
     ),
+    (
+        # Same-length lines without the fixed column layout
+        """
+        Card 1: 1 22 | 1 22
+        Card 2: 3 44 | 3 44
+        """,
+        3
+    ),
+    (
+        # Blank fields in both halves must not match each other
+        """
+        Card 1:  1     2 |  3     4
+        Card 2:  5  6  7 |  8  9 10
+        """,
+        2
+    ),
 ]
 
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
-
 # Solution
 def parse_card(line):
     full_card = line.split(': ')
@@ -82,36 +82,121 @@ def parse_card(line):
     numbers = [int(number) for number in numbers if number]
     return winners, numbers
 
-def score_card(winners, numbers):
-    matches = set(winners) & set(numbers)
-    num_pairs = len(matches)
-    score = 2 ** (num_pairs - 1) if num_pairs else 0
-    return score
+def number_mask(numbers):
+    """Encode a set of small non-negative numbers as the bits of an int."""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << number
+    return mask
 
-def get_pairs(winners, numbers):
-    matches = set(winners) & set(numbers)
-    num_pairs = len(matches)
-    return num_pairs
+def count_matches(lines: Lines):
+    """The number of winning numbers held on each card, by popcount."""
+    matches = []
+    for line in lines:
+        winners, numbers = parse_card(line)
+        matches.append((number_mask(winners) & number_mask(numbers)).bit_count())
+    return matches
+
+def parse_card_matrix(data: bytes):
+    """Decode a whole card table with a fixed column layout in one shot.
+
+    Every line must be the same length, with the ':' and '|' in the same
+    columns and the numbers right-aligned in FIELD_WIDTH-wide fields, one
+    space apart, as in the puzzle input.  The bytes are viewed as a
+    (cards x line length) array, and the digit columns of every field are
+    combined at once.  Returns (winners, held), two int matrices with a row
+    per card.  Raises ValueError if the layout isn't fixed.
+    """
+    import numpy as np
+
+    data = data.strip(b"\n") + b"\n"
+    width = data.index(b"\n") + 1
+    if len(data) % width:
+        raise ValueError("Card lines have different lengths")
+    table = np.frombuffer(data, dtype=np.uint8).reshape(-1, width)
+    colon = data.index(b":")
+    bar = data.index(b"|")
+    if not ((table[:, colon] == ord(":")).all() and (table[:, bar] == ord("|")).all()):
+        raise ValueError("Card columns are not aligned")
+
+    step = FIELD_WIDTH + 1
+    def fields(first, last):
+        # first and last are the first and last columns of the region.
+        if (last - first + 1) % step != FIELD_WIDTH:
+            raise ValueError("Card numbers do not fill whole fixed-width fields")
+        starts = np.arange(first, last + 1, step)
+        if not (table[:, starts - 1] == ord(" ")).all():
+            raise ValueError("Card numbers are not separated by single spaces")
+        chars = table[:, starts[:, np.newaxis] + np.arange(FIELD_WIDTH)]
+        digits = chars.astype(np.int64) - ord("0")
+        is_space = chars == ord(" ")
+        if not ((is_space | ((digits >= 0) & (digits <= 9))).all()):
+            raise ValueError("Card numbers are not in fixed-width fields")
+        if (is_space[:, :, 1:] & ~is_space[:, :, :-1]).any():
+            raise ValueError("Card numbers are not right-aligned")
+        if is_space.all(axis=2).any():
+            raise ValueError("Card has a blank number field")
+        digits[is_space] = 0
+        return digits @ (10 ** np.arange(FIELD_WIDTH - 1, -1, -1))
+
+    if not (table[:, bar - 1] == ord(" ")).all():
+        raise ValueError("Card numbers are not separated from the '|'")
+    return fields(colon + 2, bar - 2), fields(bar + 2, width - 2)
+
+def load_card_matrix(infile):
+    """Read a card table file straight into (winners, held) matrices."""
+    return parse_card_matrix(load_bytes(infile))
+
+def matrix_matches(winners, held):
+    """The matches on each card, from one broadcast comparison.
+
+    Like count_matches(), a winning number counts once however many times
+    it is repeated: the winners are sorted along each row and only the
+    first of each run of equal numbers is counted.
+    """
+    import numpy as np
+
+    winners = np.sort(winners, axis=1)
+    first = np.ones(winners.shape, dtype=bool)
+    first[:, 1:] = winners[:, 1:] != winners[:, :-1]
+    held_here = (winners[:, :, np.newaxis] == held[:, np.newaxis, :]).any(axis=2)
+    return (held_here & first).sum(axis=1)
+
+def card_matches(lines: Lines):
+    """The matches on each card: by matrix if the layout is fixed, else by bitmask."""
+    try:
+        winners, held = parse_card_matrix("\n".join(lines).encode())
+    except ValueError:
+        return count_matches(lines)
+    return matrix_matches(winners, held).tolist()
+
+def count_copies(matches):
+    """The number of copies of each card won, including the original.
+
+    Card i adds its copy count to the next matches[i] cards.  Rather than
+    adding to each of them, the count goes into a difference array at the
+    start and end of that window, and a running sum picks it up, so the
+    whole pass is linear in the number of cards however wide the windows.
+    """
+    diff = [0] * (len(matches) + 1)
+    copies = []
+    running = 0
+    for i, num_matches in enumerate(matches):
+        running += diff[i]
+        count = running + 1
+        copies.append(count)
+        if num_matches:
+            diff[i + 1] += count
+            diff[min(len(matches), i + 1 + num_matches)] -= count
+    return copies
 
 def solve2(lines: Lines) -> int:
     """Solve the problem."""
-    num_cards = [1] * len(lines)
-    for i in range(len(lines)):
-        line = lines[i]
-        winners, numbers = parse_card(line)
-        num_pairs = get_pairs(winners, numbers)
-        for j in range(i + 1, i + num_pairs + 1):
-            if j < len(num_cards):
-                num_cards[j] += num_cards[i]
-    return sum(num_cards)
+    return sum(count_copies(card_matches(lines)))
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
-    sum_score = 0
-    for line in lines:
-        winners, numbers = parse_card(line)
-        sum_score += score_card(winners, numbers)
-    return sum_score
+    return sum(1 << (num_matches - 1) for num_matches in card_matches(lines) if num_matches)
 
 
 # PART 1
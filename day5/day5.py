@@ -2,12 +2,12 @@
 #
 #  Advent of Code 2023 - Day 5
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
-import math
-import re
+from bisect import bisect_right
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
 
 INPUTFILE = "input.txt"
 
@@ -94,38 +94,9 @@ SAMPLE_CASES2 = [
 ]
 
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
 NUM_MAPS = 7
+DOMAIN_END = 1 << 62
+SEED_CHUNK = 1 << 20
 
 # Solution
 def parse_lines(lines):
@@ -152,64 +123,219 @@ def get_location(seed, maps):
                 break
     return seed
 
-def get_seed(location, maps):
-    for map_ranges in maps[::-1]:
-        for dest, source, length in map_ranges:
-            if dest <= location < dest + length:
-                location = location + source - dest
-                break
-    return location
+def map_entries(map_ranges):
+    """A map's ranges as sorted (source, source end, offset) entries, and their sources."""
+    entries = sorted((source, source + length, dest - source)
+                     for dest, source, length in map_ranges)
+    return entries, [source for source, _, _ in entries]
 
-def get_location2(seed_min, seed_max, maps):
-    ranges = [(seed_min, seed_max)]
-    processed_ranges = []
+def split_interval(start, end, entries, sources):
+    """Yield the (start, end, offset) pieces of an interval under one map.
+
+    The interval is split where it crosses the edges of the map's source
+    ranges; each piece comes with the offset the map adds to it (0 for the
+    numbers that pass through unchanged).  The first overlapping range is
+    found by bisection.
+    """
+    i = max(0, bisect_right(sources, start) - 1)
+    while start < end:
+        if i < len(entries) and entries[i][1] <= start:
+            i += 1
+            continue
+        if i == len(entries) or entries[i][0] >= end:
+            yield start, end, 0
+            return
+        source, source_end, offset = entries[i]
+        if start < source:
+            yield start, source, 0
+            start = source
+        piece_end = min(end, source_end)
+        yield start, piece_end, offset
+        start = piece_end
+        i += 1
+
+def map_intervals(intervals, map_ranges):
+    """Push half-open (start, end) intervals through one map.
+
+    The pieces inside a source range are offset to its destination, and the
+    rest pass through unchanged.  The work depends on the number of
+    intervals and map ranges, not on how many numbers they cover.
+    """
+    entries, sources = map_entries(map_ranges)
+    return merge_intervals((lo + offset, hi + offset)
+                           for start, end in intervals
+                           for lo, hi, offset in split_interval(start, end, entries, sources))
+
+def merge_intervals(intervals):
+    """Sort intervals and join the ones that overlap or touch."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def get_location_intervals(intervals, maps):
     for map_ranges in maps:
-        while ranges:
-            range_min, range_max = ranges[0]
-            ranges = ranges[1:]
-            for dest, source, length in map_ranges:
-                map_min = source
-                map_max = source + length
-                offset = dest - source
-                if map_max <= range_min or range_min <= map_max:
-                    continue
-                if range_min < map_min:
-                    processed_ranges.append((range_min, map_min))
-                    range_min = map_min
-                if map_min < range_min:
-                    processed_ranges.append((map_max, range_max))
-                    range_max = map_max
-                processed_ranges.append((range_min + offset, range_max + offset))
-                print(processed_ranges)
-                break
+        intervals = map_intervals(intervals, map_ranges)
+    return intervals
+
+class Almanac:
+    """All of the maps composed into one piecewise-linear function.
+
+    Segment k covers the seeds from starts[k] up to the next start (or
+    DOMAIN_END), and maps them to seed + offsets[k].  A seed's segment is
+    found by bisection, or by np.searchsorted for a whole array of seeds.
+
+    The segments' images are indexed the same way for the inverse, which
+    needs the images not to overlap, i.e. every map must be a bijection:
+    numbers a map passes through unchanged can otherwise land on another
+    range's destination.  The puzzle's maps are; invertible records whether
+    the composed images really are disjoint.
+    """
+
+    def __init__(self, segments):
+        self.starts = [start for start, _, _ in segments]
+        self.ends = [end for _, end, _ in segments]
+        self.offsets = [offset for _, _, offset in segments]
+        images = sorted((start + offset, end + offset, -offset) for start, end, offset in segments)
+        self.image_starts = [start for start, _, _ in images]
+        self.image_ends = [end for _, end, _ in images]
+        self.image_offsets = [offset for _, _, offset in images]
+        self.invertible = all(end <= start for end, start in zip(self.image_ends, self.image_starts[1:]))
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def location(self, seed: int) -> int:
+        if not 0 <= seed < DOMAIN_END:
+            raise ValueError(f"Seed {seed} is outside the almanac")
+        return seed + self.offsets[bisect_right(self.starts, seed) - 1]
+
+    def seed(self, location: int) -> int:
+        """The seed that ends up at a location."""
+        if not self.invertible:
+            raise ValueError("Almanac maps several seeds to the same location")
+        k = bisect_right(self.image_starts, location) - 1
+        if k < 0 or location >= self.image_ends[k]:
+            raise ValueError(f"No seed maps to location {location}")
+        return location + self.image_offsets[k]
+
+    def arrays(self):
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = tuple(np.array(values, dtype=np.int64) for values in (
+                self.starts, self.offsets, self.image_starts, self.image_ends, self.image_offsets))
+        return self._arrays
+
+    def locations(self, seeds):
+        """Map an array of seeds to their locations at once."""
+        import numpy as np
+
+        seeds = np.asarray(seeds, dtype=np.int64)
+        if seeds.size and (seeds.min() < 0 or seeds.max() >= DOMAIN_END):
+            raise ValueError("Seeds are outside the almanac")
+        starts, offsets = self.arrays()[:2]
+        return seeds + offsets[np.searchsorted(starts, seeds, side="right") - 1]
+
+    def seeds(self, locations):
+        """Map an array of locations back to their seeds at once."""
+        import numpy as np
+
+        if not self.invertible:
+            raise ValueError("Almanac maps several seeds to the same location")
+        locations = np.asarray(locations, dtype=np.int64)
+        image_starts, image_ends, image_offsets = self.arrays()[2:]
+        k = np.searchsorted(image_starts, locations, side="right") - 1
+        if ((k < 0) | (locations >= image_ends[np.maximum(k, 0)])).any():
+            raise ValueError("Some locations have no seed")
+        return locations + image_offsets[k]
+
+def compile_almanac(maps) -> Almanac:
+    """Compose the maps, in order, into one Almanac.
+
+    Starting from the identity on [0, DOMAIN_END), each segment's image is
+    split by the next map, and each piece is carried back to the seeds it
+    came from with the two offsets added together.  Neighboring segments
+    with the same offset are joined.
+    """
+    segments = [(0, DOMAIN_END, 0)]
+    for map_ranges in maps:
+        entries, sources = map_entries(map_ranges)
+        composed = []
+        for start, end, offset in segments:
+            for lo, hi, shift in split_interval(start + offset, end + offset, entries, sources):
+                composed.append((lo - offset, hi - offset, offset + shift))
+        segments = []
+        for start, end, offset in sorted(composed):
+            if segments and segments[-1][1] == start and segments[-1][2] == offset:
+                segments[-1] = (segments[-1][0], end, offset)
             else:
-                processed_ranges.append((range_min, range_max))
-        ranges = processed_ranges
-        processed_ranges = []
-    return ranges
+                segments.append((start, end, offset))
+    return Almanac(segments)
 
-def solve2(lines: Lines) -> int:
-    """Solve the problem."""
+def compile_stages(maps):
+    """Each map as (source starts, source ends, offsets) arrays, sorted by start."""
+    import numpy as np
+
+    stages = []
+    for map_ranges in maps:
+        entries, _ = map_entries(map_ranges)
+        stages.append(tuple(np.array(column, dtype=np.int64).reshape(-1)
+                            for column in zip(*entries)) if entries else None)
+    return stages
+
+def locate_seed_array(seeds, stages):
+    """Push an array of seeds through every map stage at once.
 
-    seed_ranges, maps = parse_lines(lines)
-    seed_ranges = list(zip(seed_ranges[::2], seed_ranges[1::2]))
+    In each stage, np.searchsorted finds the last source range starting at
+    or before each seed, a mask keeps the seeds that fall inside it, and
+    the range's offset is gathered and added to those.
     """
-    locations = []
-    for seed_min, length in seed_ranges:
-        locations += get_location2(seed_min, seed_min+length, maps)
+    import numpy as np
+
+    values = np.array(seeds, dtype=np.int64)
+    for stage in stages:
+        if stage is None:
+            continue
+        starts, ends, offsets = stage
+        k = np.searchsorted(starts, values, side="right") - 1
+        k_safe = np.maximum(k, 0)
+        inside = (k >= 0) & (values < ends[k_safe])
+        values += np.where(inside, offsets[k_safe], 0)
+    return values
+
+def locate_seeds(seeds, maps, minimum=False, chunk_size=SEED_CHUNK):
+    """Map a large batch of seeds to their locations, chunk by chunk.
+
+    Returns the array of locations, or with minimum set, just the lowest
+    location, in which case only one chunk of locations exists at a time.
     """
-    for i in range(2000000000000):
-        seed = get_seed(i, maps)
-        for seed_range in seed_ranges:
-            if seed_range[0] <= seed < seed_range[0] + seed_range[1]:
-                return i
-    return min(range_min for range_min, _ in locations)
+    import numpy as np
+
+    seeds = np.asarray(seeds, dtype=np.int64).reshape(-1)
+    stages = compile_stages(maps)
+    chunks = (locate_seed_array(seeds[i:i + chunk_size], stages)
+              for i in range(0, len(seeds), chunk_size))
+    if minimum:
+        return min(int(chunk.min()) for chunk in chunks)
+    return np.concatenate(list(chunks)) if len(seeds) else seeds.copy()
+
+def solve2(lines: Lines) -> int:
+    """Solve the problem."""
+    seeds, maps = parse_lines(lines)
+    seed_ranges = [(start, start + length) for start, length in zip(seeds[::2], seeds[1::2])]
+    locations = get_location_intervals(merge_intervals(seed_ranges), maps)
+    return locations[0][0]
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
     seeds, maps = parse_lines(lines)
-    seeds = [get_location(seed,maps) for seed in seeds]
-    return min(seeds)
+    almanac = compile_almanac(maps)
+    return min(almanac.location(seed) for seed in seeds)
 
 
 # PART 1
@@ -228,6 +354,9 @@ def part1(lines: Lines) -> None:
     print("PART 1:")
     result = solve(lines)
     print(f"result is {result}")
+    assert result == 240320250
+    seeds, maps = parse_lines(lines)
+    assert locate_seeds(seeds, maps, minimum=True) == result
     print("= " * 32)
 
 
@@ -247,6 +376,7 @@ def part2(lines: Lines) -> None:
     print("PART 2:")
     result = solve2(lines)
     print(f"result is {result}")
+    assert result == 28580589
     print("= " * 32)
 
 
@@ -2,14 +2,15 @@
 #
 #  Advent of Code 2023 - Day 6
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from dataclasses import dataclass
 import math
-import re
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
 
 INPUTFILE = "input.txt"
+MAX_ARRAY_TIME = 3_000_000_000
 
 SAMPLE_CASES = [
     (
@@ -32,38 +33,6 @@ SAMPLE_CASES2 = [
 ]
 
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
-
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
-
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
-
 # Solution
 def parse_lines(lines):
     times = []
@@ -81,33 +50,61 @@ def parse_lines2(lines):
     distance = int(distance)
     return time, distance
 
-def possible_combos(time, distance):
-    combos = 0
-    past_peak = False
-    for hold_time in range(1, time):
-        new_dist = hold_time * (time - hold_time)
-        if new_dist > distance:
-            combos += 1
-            past_peak = True
-        if new_dist < distance and past_peak:
-            return combos
-    return combos
-
-def optimized_possible_combos(time, distance):
-    high = (time + (time**2 - 4*distance)**(1/2)) / 2.0
-    low  = (time - (time**2 - 4*distance)**(1/2)) / 2.0
-    return math.ceil(high) - math.floor(low) - 1
+def count_wins(time, distance):
+    """The number of whole hold times that beat the distance, exactly.
+
+    Holding for h travels h * (time - h), which beats the distance strictly
+    between the roots of h**2 - time*h + distance.  math.isqrt gives the
+    floor of the square root of the discriminant, so (time - root) // 2 is
+    the first winning hold or one short of it; one check corrects it, and
+    the window is symmetric about time / 2.  Works for integers of any size.
+    """
+    disc = time * time - 4 * distance
+    if disc <= 0:
+        return 0
+    low = max(0, (time - math.isqrt(disc)) // 2)
+    if low * (time - low) <= distance:
+        low += 1
+    return max(0, time - 2 * low + 1)
+
+def count_wins_array(times, distances):
+    """count_wins for arrays of (time, distance) pairs at once.
+
+    The roots come from a float square root, corrected to the exact integer
+    root in int64.  That is exact while time**2 fits in an int64; beyond
+    that, the pairs are counted one by one with Python integers.
+    """
+    import numpy as np
+
+    times = np.asarray(times)
+    distances = np.asarray(distances)
+    if times.size and (times.dtype == object or distances.dtype == object
+                       or np.abs(times).max() > MAX_ARRAY_TIME
+                       or np.abs(distances).max() > MAX_ARRAY_TIME ** 2 // 4):
+        return np.array([count_wins(int(time), int(distance))
+                         for time, distance in zip(times.ravel(), distances.ravel())],
+                        dtype=object).reshape(times.shape)
+
+    times = times.astype(np.int64)
+    distances = distances.astype(np.int64)
+    disc = times * times - 4 * distances
+    root = np.sqrt(np.maximum(disc, 0).astype(np.float64)).astype(np.int64)
+    root -= root * root > disc
+    root += (root + 1) * (root + 1) <= disc
+    low = np.maximum(0, (times - root) // 2)
+    low += low * (times - low) <= distances
+    return np.where(disc > 0, np.maximum(0, times - 2 * low + 1), 0)
 
 def solve2(lines: Lines) -> int:
     """Solve the problem."""
     time, distance = parse_lines2(lines)
-    combos = optimized_possible_combos(time, distance)
+    combos = count_wins(time, distance)
     return combos
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
     times, distances = parse_lines(lines)
-    combos = [optimized_possible_combos(time, distance) for time, distance in zip(times, distances)]
+    combos = [count_wins(time, distance) for time, distance in zip(times, distances)]
     return math.prod(combos)
 
 
@@ -127,6 +124,7 @@ def part1(lines: Lines) -> None:
     print("PART 1:")
     result = solve(lines)
     print(f"result is {result}")
+    assert math.prod(count_wins_array(*parse_lines(lines)).tolist()) == result
     print("= " * 32)
 
 
@@ -146,6 +144,8 @@ def part2(lines: Lines) -> None:
     print("PART 2:")
     result = solve2(lines)
     print(f"result is {result}")
+    time, distance = parse_lines2(lines)
+    assert count_wins_array([time], [distance])[0] == result
     print("= " * 32)
 
 
@@ -2,13 +2,12 @@
 #
 #  Advent of Code 2023 - Day 7
 #
-from typing import Sequence, Union, Optional, Any, Dict, List, Tuple
+import sys
 from pathlib import Path
-from collections import defaultdict
-from collections import Counter
-from dataclasses import dataclass
-import math
-import re
+from bisect import bisect_left, insort
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from aoclib import Lines, load_input, load_text
 
 INPUTFILE = "input.txt"
 
@@ -38,107 +37,270 @@ SAMPLE_CASES2 = [
     ),
 ]
 
-Lines = Sequence[str]
-Sections = Sequence[Lines]
-
-# Utility functions
 
-def load_input(infile: str, strip=True, blank_lines=False) -> Lines:
-    return load_text(Path(infile).read_text())
+CARD_ORDER = "23456789TJQKA"
+JOKER_ORDER = "J23456789TQKA"
+RANKS = str.maketrans(CARD_ORDER, "0123456789abc")
+JOKER_RANKS = str.maketrans(JOKER_ORDER, "0123456789abc")
 
-def load_text(text: str, strip=True, blank_lines=False) -> Lines:
-    if strip:
-        lines = [line.strip() for line in text.strip("\n").split("\n")]
-    else:
-        lines = [line for line in text.strip("\n").split("\n")]
-    if blank_lines:
-        return lines
-    return [line for line in lines if line.strip()]
-
-def parse_sections(lines: Lines) -> Sections:
-    result = []
-    sect = []
-    for line in lines:
-        if not line.strip():
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
-HAND_ORDER = [[1,1,1,1,1], [2,1,1,1], [2,2,1], [3,1,1], [3,2], [4,1], [5]]
-
-# abusing ascii values so we can just use built-in sorting
-REPLACEMENTS = {"J" : "U", "Q" : "V", "K" : "W", "A": "X"}
-REPLACEMENTS_2 = {"J" : "*", "Q" : "V", "K" : "W", "A": "X"}
+# Summing each card's count over the hand gives the sum of the squared
+# counts, which is different for every hand type: sum -> type, weakest first.
+HAND_TYPES = {5: 0, 7: 1, 9: 2, 11: 3, 13: 4, 17: 5, 25: 6}
+# The five card ranks, read as a base-13 number, are below 13**5 < 2**20.
+TYPE_SHIFT = 20
+NUM_RANKS = len(CARD_ORDER)
+TYPE_TABLE = [HAND_TYPES.get(squares, -1) for squares in range(26)]
+KEY_SPACE = len(HAND_TYPES) * NUM_RANKS ** 5
 
 # Solution
-def make_replacements(hand, repl_dict):
-    for text, replace in repl_dict.items():
-        hand = hand.replace(text, replace)
-    return hand
-
-def flatten(l):
-    return [item for sublist in l for item in sublist if item]
-
-def parse_lines(lines, repl_dict):
+def parse_lines(lines):
     hands = []
     bids = []
     for line in lines:
-        hands += [line.split()[0]]
-        bids  += [line.split()[1]]
-    hands = [make_replacements(hand, repl_dict) for hand in hands]
-    bids  = [int(bid) for bid in bids]
+        hand, bid = line.split()
+        hands.append(hand)
+        bids.append(int(bid))
     return hands, bids
 
-def get_hand_type(hand):
-    card_freq = {}
-    for card in hand:
-        card_freq[card] = card_freq.get(card, 0) + 1
-    return HAND_ORDER.index(sorted(list(card_freq.values()), reverse=True))
-
-def get_hand_type_wilds(hand):
-    card_freq = {}
-    # all jokers, just return that we have 5 of a kind 
-    if hand == '*****':
-        return 6
-    for card in hand:
-        if card != '*':
-            card_freq[card] = card_freq.get(card, 0) + 1
-    most_freq_card = max(card_freq, key=card_freq.get)
-    for card in hand:
-        if card == '*':
-            card_freq[most_freq_card] += 1
-    return HAND_ORDER.index(sorted(list(card_freq.values()), reverse=True))
+def hand_key(hand, jokers=False):
+    """One integer that sorts hands by strength.
+
+    The hand type, looked up from the sum of the card counts, goes in the
+    high bits, and the card ranks, translated to base-13 digits and read as
+    one number, go below it.  With jokers, the J cards rank lowest and
+    count as whichever other card there is most of.
+    """
+    if jokers:
+        ranks = int(hand.translate(JOKER_RANKS), 13)
+        if "J" in hand and hand != "JJJJJ":
+            others = hand.replace("J", "")
+            hand = hand.replace("J", max(others, key=others.count))
+    else:
+        ranks = int(hand.translate(RANKS), 13)
+    return HAND_TYPES[sum(map(hand.count, hand))] << TYPE_SHIFT | ranks
+
+def total_winnings(hands, bids, jokers=False):
+    """Rank the hands with a single sort and total each bid times its rank.
+
+    Each bid is packed into the low bits of its hand's key, so the sort
+    compares plain integers and carries the bids along.
+    """
+    bid_bits = max(bids, default=0).bit_length()
+    mask = (1 << bid_bits) - 1
+    packed = sorted(hand_key(hand, jokers) << bid_bits | bid for hand, bid in zip(hands, bids))
+    return sum(rank * (key & mask) for rank, key in enumerate(packed, 1))
+
+def rank_array(hands, order=CARD_ORDER):
+    """The hands as an (n x 5) uint8 array of card ranks in the given order."""
+    import numpy as np
+
+    table = np.full(256, 255, dtype=np.uint8)
+    table[np.frombuffer(order.encode(), dtype=np.uint8)] = np.arange(len(order))
+    ranks = table[np.frombuffer("".join(hands).encode(), dtype=np.uint8)].reshape(-1, 5)
+    if (ranks == 255).any():
+        raise ValueError(f"Hands may only hold the cards {order}")
+    return ranks
+
+def classify_hands(ranks, wild=None):
+    """The type of each hand in an (n x 5) rank array, weakest first.
+
+    A histogram of each hand's ranks comes from one np.bincount over the
+    whole array, offset by row.  If wild is a rank, cards of that rank are
+    taken out of the histogram and added to the largest count left, all in
+    one vectorized step.  The type then follows from the sum of the squared
+    counts, as in HAND_TYPES.
+    """
+    import numpy as np
+
+    n = len(ranks)
+    rows = np.arange(n, dtype=np.int64)[:, np.newaxis] * NUM_RANKS
+    counts = np.bincount((rows + ranks).ravel(), minlength=n * NUM_RANKS)
+    counts = counts.reshape(n, NUM_RANKS)
+    if wild is not None:
+        wilds = counts[:, wild].copy()
+        counts[:, wild] = 0
+        most = counts.max(axis=1)
+        squares = (counts * counts).sum(axis=1) - most * most + (most + wilds) ** 2
+    else:
+        squares = (counts * counts).sum(axis=1)
+    return np.array(TYPE_TABLE, dtype=np.int8)[squares]
+
+def hand_keys_array(hands, order=CARD_ORDER, wild=None):
+    """hand_key for a list of hands at once, under any card order and wild card.
+
+    (CARD_ORDER, None) gives the part 1 rules and (JOKER_ORDER, "J") the
+    part 2 rules; other variants just need a different order or wild card.
+    """
+    import numpy as np
+
+    ranks = rank_array(hands, order)
+    types = classify_hands(ranks, None if wild is None else order.index(wild))
+    places = NUM_RANKS ** np.arange(4, -1, -1, dtype=np.int64)
+    return types.astype(np.int64) << TYPE_SHIFT | ranks.astype(np.int64) @ places
+
+def total_winnings_array(hands, bids, order=CARD_ORDER, wild=None):
+    """total_winnings on the array engine, ranking with one lexsort."""
+    import numpy as np
+
+    bids = np.asarray(bids, dtype=np.int64)
+    ranked = bids[np.lexsort((bids, hand_keys_array(hands, order, wild)))]
+    return int(ranked @ np.arange(1, len(ranked) + 1, dtype=np.int64))
+
+class Fenwick:
+    """A Fenwick (binary indexed) tree over positions 0..size-1.
+
+    The nodes live in a dict, so a huge, mostly empty position space costs
+    nothing until it is used; each update touches O(log size) nodes.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = {}
+
+    def add(self, pos: int, delta: int) -> None:
+        i = pos + 1
+        while i <= self.size:
+            self.tree[i] = self.tree.get(i, 0) + delta
+            i += i & -i
+
+    def prefix(self, pos: int) -> int:
+        """The sum over positions [0, pos)."""
+        total = 0
+        i = pos
+        while i > 0:
+            total += self.tree.get(i, 0)
+            i -= i & -i
+        return total
+
+    def search(self, target: int) -> int:
+        """The first position where the running sum reaches target (values >= 0)."""
+        pos = 0
+        step = 1 << (self.size.bit_length() - 1)
+        while step:
+            node = pos + step
+            if node <= self.size:
+                value = self.tree.get(node, 0)
+                if value < target:
+                    pos = node
+                    target -= value
+            step >>= 1
+        return pos
+
+class HandTable:
+    """A table of hands kept ranked as hands come and go.
+
+    Each hand's key is turned into a dense slot (type * 13**5 + ranks), and
+    two Fenwick trees over the slots count the hands and sum their bids.
+    Adding a hand at rank r raises the rank of every stronger hand by one,
+    so the total winnings change by r * bid plus the bids above it: both are
+    O(log n) prefix queries.  Identical hands rank by bid, as in
+    total_winnings(); their bids are kept sorted per slot.
+    """
+
+    def __init__(self, jokers=False):
+        self.jokers = jokers
+        self.order = JOKER_ORDER if jokers else CARD_ORDER
+        self.counts = Fenwick(KEY_SPACE)
+        self.bid_sums = Fenwick(KEY_SPACE)
+        self.bids = {}
+        self.total = 0
+        self.bid_total = 0
+
+    def __len__(self):
+        return self.counts.prefix(KEY_SPACE)
+
+    def slot(self, hand: str) -> int:
+        key = hand_key(hand, self.jokers)
+        return (key >> TYPE_SHIFT) * NUM_RANKS ** 5 + (key & ((1 << TYPE_SHIFT) - 1))
+
+    def hand(self, slot: int) -> str:
+        """The hand in a slot, read back from its base-13 card ranks."""
+        ranks = slot % NUM_RANKS ** 5
+        cards = []
+        for _ in range(5):
+            ranks, rank = divmod(ranks, NUM_RANKS)
+            cards.append(self.order[rank])
+        return "".join(reversed(cards))
+
+    def _rank_and_above(self, slot: int, same, i: int):
+        rank = self.counts.prefix(slot) + i + 1
+        above = self.bid_total - self.bid_sums.prefix(slot + 1) + sum(same[i:])
+        return rank, above
+
+    def add(self, hand: str, bid: int) -> int:
+        """Add a hand; return the rank it gets (1 is the weakest)."""
+        slot = self.slot(hand)
+        same = self.bids.setdefault(slot, [])
+        i = bisect_left(same, bid)
+        rank, above = self._rank_and_above(slot, same, i)
+        self.total += rank * bid + above
+        insort(same, bid)
+        self.counts.add(slot, 1)
+        self.bid_sums.add(slot, bid)
+        self.bid_total += bid
+        return rank
+
+    def remove(self, hand: str, bid: int) -> None:
+        """Remove a hand that was added with this bid."""
+        slot = self.slot(hand)
+        same = self.bids.get(slot, [])
+        i = bisect_left(same, bid)
+        if i == len(same) or same[i] != bid:
+            raise KeyError(f"No hand {hand} with bid {bid}")
+        del same[i]
+        if not same:
+            del self.bids[slot]
+        self.counts.add(slot, -1)
+        self.bid_sums.add(slot, -bid)
+        self.bid_total -= bid
+        rank, above = self._rank_and_above(slot, same, i)
+        self.total -= rank * bid + above
+
+    def at_rank(self, rank: int):
+        """The (hand, bid) at a rank, 1 being the weakest."""
+        if not 1 <= rank <= len(self):
+            raise IndexError(f"No rank {rank}")
+        slot = self.counts.search(rank)
+        return self.hand(slot), self.bids[slot][rank - self.counts.prefix(slot) - 1]
+
+    def top(self, k: int):
+        """The k strongest hands as (rank, hand, bid), strongest first."""
+        n = len(self)
+        return [(rank, *self.at_rank(rank)) for rank in range(n, max(0, n - k), -1)]
+
+def check_hand_table(lines: Lines, jokers: bool, expected: int) -> None:
+    """Build a HandTable from the input and check it against a full ranking.
+
+    Every seventh hand is taken out again, the total is compared with a
+    fresh total_winnings() over the rest, and the hands are put back.
+    """
+    hands, bids = parse_lines(lines)
+    table = HandTable(jokers)
+    for hand, bid in zip(hands, bids):
+        table.add(hand, bid)
+    assert table.total == expected
+    assert len(table) == len(hands)
+
+    removed = list(zip(hands, bids))[::7]
+    for hand, bid in removed:
+        table.remove(hand, bid)
+    kept = [pair for i, pair in enumerate(zip(hands, bids)) if i % 7]
+    assert table.total == total_winnings([h for h, _ in kept], [b for _, b in kept], jokers)
+    for hand, bid in removed:
+        table.add(hand, bid)
+    assert table.total == expected
+    ranked = sorted(zip(hands, bids), key=lambda pair: (hand_key(pair[0], jokers), pair[1]))
+    assert [(hand, bid) for _, hand, bid in table.top(3)] == ranked[:-4:-1]
 
 def solve2(lines: Lines) -> int:
     """Solve the problem."""
-    hands, bids = parse_lines(lines, REPLACEMENTS_2)
-    sorted_hands = [[] for _ in range(len(HAND_ORDER))]
-    for hand,bid in zip(hands,bids):
-        sorted_hands[get_hand_type_wilds(hand)].append((hand, bid))
-    sorted_hands = [sorted(group) for group in sorted_hands]
-    sorted_hands = flatten(sorted_hands)
-    score = 0
-    for i in range(len(sorted_hands)):
-        score += sorted_hands[i][1] * (i+1)
-    return score
+    hands, bids = parse_lines(lines)
+    return total_winnings(hands, bids, jokers=True)
 
 def solve(lines: Lines) -> int:
     """Solve the problem."""
-    hands, bids = parse_lines(lines, REPLACEMENTS)
-    sorted_hands = [[] for _ in range(len(HAND_ORDER))]
-    for hand,bid in zip(hands,bids):
-        sorted_hands[get_hand_type(hand)].append((hand, bid))
-    sorted_hands = [sorted(group) for group in sorted_hands]
-    sorted_hands = flatten(sorted_hands)
-    score = 0
-    for i in range(len(sorted_hands)):
-        score += sorted_hands[i][1] * (i+1)
-    return score
+    hands, bids = parse_lines(lines)
+    return total_winnings(hands, bids)
 
 
 # PART 1
@@ -157,6 +319,8 @@ def part1(lines: Lines) -> None:
     print("PART 1:")
     result = solve(lines)
     print(f"result is {result}")
+    assert total_winnings_array(*parse_lines(lines)) == result
+    check_hand_table(lines, jokers=False, expected=result)
     print("= " * 32)
 
 
@@ -176,6 +340,8 @@ def part2(lines: Lines) -> None:
     print("PART 2:")
     result = solve2(lines)
     print(f"result is {result}")
+    assert total_winnings_array(*parse_lines(lines), JOKER_ORDER, "J") == result
+    check_hand_table(lines, jokers=True, expected=result)
     print("= " * 32)
 
 
@@ -1,15 +1,30 @@
 #!/usr/bin/env python
 """
 A utility module for pulling data from the AdventOfCode site.
+
+With --days, descriptions and/or inputs for a range of days are fetched
+concurrently, by a small pool of threads sharing one client, and written to
+dayN/dayN.md and dayN/input.txt.
 """
 import sys
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
+import hashlib
 import logging
+import os
+import threading
 
 import requests
-from bs4 import BeautifulSoup
-from markdownify import markdownify
+from bs4 import BeautifulSoup, SoupStrainer
+from markdownify import MarkdownConverter
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 import aoc
 
@@ -24,6 +39,10 @@ SUFFIX_FORMAT = {
     ".md": FMT_MD,
     ".txt": FMT_TEXT,
 }
+FORMAT_SUFFIX = {fmt: suffix for suffix, fmt in SUFFIX_FORMAT.items()}
+
+INPUT_FILENAME = "input.txt"
+DEFAULT_WORKERS = 4
 
 
 logging.basicConfig(format="%(message)s", stream=sys.stdout, level=logging.INFO)
@@ -51,6 +70,26 @@ def parse_args():
         action="store_true",
         help="Download the day's input file",
     )
+    parser.add_argument(
+        "--days",
+        help="Download a range of days, e.g. '1-25', into the dayN/ directories",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="With --days, download both the descriptions and the input files",
+    )
+    parser.add_argument(
+        "--outdir",
+        default=str(aoc.BASE_DIR),
+        help="With --days, the directory holding the dayN/ directories",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent downloads with --days (default: {DEFAULT_WORKERS})",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -60,6 +99,15 @@ def parse_args():
 
     opt = parser.parse_args()
 
+    if opt.days:
+        opt.days = parse_days(opt.days)
+        if opt.outfile:
+            raise UsageError("--outfile can't be used with --days")
+        if opt.workers < 1:
+            raise UsageError("--workers must be at least 1")
+    elif opt.all:
+        raise UsageError("--all only applies with --days")
+
     if opt.input and opt.format:
         logger.warning("--format is ignored when writing input data")
         opt.format = FMT_MD
@@ -77,6 +125,102 @@ def parse_args():
 
     return opt
 
+def parse_days(spec: str) -> List[int]:
+    """Parse a day list like '1-25' or '1,3,5' into a sorted list of days."""
+    days = set()
+    try:
+        for item in spec.split(","):
+            if "-" in item:
+                first, last = item.split("-", 1)
+                days.update(range(int(first), int(last) + 1))
+            elif item.strip():
+                days.add(int(item))
+    except ValueError:
+        raise UsageError(f"Unrecognized day list '{spec}'")
+    return sorted(days)
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write text to path, so readers never see a partly-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(text)
+    tmp_path.replace(path)
+
+def convert_page(page_html: str, fmt: str, cache: Optional[aoc.PageCache] = None) -> str:
+    """Convert a puzzle page to the given output format.
+
+    Only the page's <main> element is parsed (with lxml, if it's installed),
+    and the parsed tree is converted directly, without serializing it back to
+    HTML first.  With a cache, the conversion is stored next to the raw page.
+    """
+    if fmt == FMT_HTML:
+        return page_html
+    digest = hashlib.sha256(page_html.encode()).hexdigest()
+    if cache:
+        output_text = cache.load_derived(digest, FMT_MD)
+        if output_text is not None:
+            return output_text
+    soup = BeautifulSoup(page_html, HTML_PARSER, parse_only=SoupStrainer("main"))
+    output_text = MarkdownConverter().convert_soup(soup)
+    if cache:
+        cache.store_derived(digest, FMT_MD, output_text)
+    return output_text
+
+def download_day(
+    aoc_client: aoc.Client,
+    year: str,
+    day: int,
+    outdir: Path,
+    fmt: str,
+    description: bool = True,
+    input_data: bool = False,
+) -> List[Path]:
+    """Download one day's description and/or input into outdir/dayN/.
+    Returns the paths written.
+    """
+    day_dir = outdir / f"day{day}"
+    written = []
+    if description:
+        page_html = aoc_client.get_page(year=year, day=str(day), check=True)
+        path = day_dir / f"day{day}{FORMAT_SUFFIX[fmt]}"
+        write_atomic(path, convert_page(page_html, fmt, aoc_client.cache))
+        written.append(path)
+    if input_data:
+        input_text = aoc_client.get_page(year=year, day=str(day), path="input", raw=True, check=True)
+        path = day_dir / INPUT_FILENAME
+        write_atomic(path, input_text)
+        written.append(path)
+    return written
+
+def download_days(
+    aoc_client: aoc.Client,
+    year: str,
+    days: List[int],
+    outdir: Path,
+    fmt: str,
+    description: bool = True,
+    input_data: bool = False,
+    workers: int = DEFAULT_WORKERS,
+) -> int:
+    """Download several days concurrently.  Returns the number of days that failed."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            day: executor.submit(
+                download_day, aoc_client, year, day, outdir, fmt, description, input_data
+            )
+            for day in days
+        }
+        failures = 0
+        for day, future in futures.items():
+            try:
+                for path in future.result():
+                    logger.info(f"Wrote {path}")
+            except requests.RequestException as exc:
+                logger.warning(f"Day {day}: {exc}")
+                failures += 1
+    return failures
+
 
 def main() -> int:
     opt = parse_args()
@@ -84,35 +228,46 @@ def main() -> int:
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("[debug mode]")
 
-    aoc_client = aoc.Client(year=opt.year, day=opt.day, session=opt.session_key)
+    aoc_client = aoc.Client(
+        year=opt.year,
+        day=opt.day,
+        session=opt.session_key,
+        cache_dir=None if opt.no_cache else opt.cache_dir,
+    )
+
+    if opt.days:
+        failures = download_days(
+            aoc_client,
+            opt.year,
+            opt.days,
+            Path(opt.outdir),
+            opt.format,
+            description=opt.all or not opt.input,
+            input_data=opt.all or opt.input,
+            workers=opt.workers,
+        )
+        return 1 if failures else 0
 
     if opt.input:
         input_text = aoc_client.get_page(year=opt.year, day=opt.day, path="input", raw=True)
         if opt.outfile:
-            with Path(opt.outfile).open("w") as fp:
-                fp.write(input_text)
-                logger.info(f"Wrote {opt.outfile}")
+            write_atomic(Path(opt.outfile), input_text)
+            logger.info(f"Wrote {opt.outfile}")
         else:
             print(input_text)
         return 0
 
     page_html = aoc_client.get_page(year=opt.year, day=opt.day)
-
-    if opt.format == FMT_HTML:
-        output_text = page_html
-    elif opt.format in (FMT_TEXT, FMT_MD):
-        soup = BeautifulSoup(page_html, "html.parser")
-        output_text = markdownify(str(soup.body.main))
+    output_text = convert_page(page_html, opt.format, aoc_client.cache)
 
     if opt.outfile:
-        with Path(opt.outfile).open("w") as fp:
-            fp.write(output_text)
-            logger.info(f"Wrote {opt.outfile}")
-            return 0
+        write_atomic(Path(opt.outfile), output_text)
+        logger.info(f"Wrote {opt.outfile}")
+        return 0
 
     print(output_text)
     return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -20,7 +20,6 @@ DAY="$1"
 dir="day${DAY}"
 prog="$dir/day${DAY}.py"
 infile="$dir/input.txt"
-desc="$dir/day${DAY}.md"
 
 mkdir -p "$dir" || error "Unable to create $dir"
 echo "Created $dir"
@@ -33,10 +32,7 @@ test -f "$prog" || \
 chmod +x "$prog"
 echo "Wrote $prog"
 
-./download.py -y $YEAR -d "$DAY" --outfile "$desc" || \
-    error "Unable to download puzzle description"
-
-./download.py -y $YEAR -d "$DAY" --input --outfile "$infile" || \
-    error "Unable to download input data"
+./download.py -y $YEAR --days "$DAY" --all || \
+    error "Unable to download puzzle description and input data"
 echo "$infile has $(wc -l $infile | awk '{print $1}') lines"
 
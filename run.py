@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Run any subset of the daily solutions in a single process.
+
+Each day's module is imported once, then each requested part is run against
+that day's input file, timing the parse (load_input) and solve phases
+separately.  Results are reported as a table or as JSON.
+
+With --jobs N, the (day, part, input) jobs are spread over a pool of N worker
+processes.  Each worker times its own jobs, and results are reported in the
+same order as a serial run.
+
+With --profile, each solve phase runs under cProfile, and its profile is
+written to the profile directory as a .pstats file and as collapsed stacks
+(a .collapsed file) that flamegraph tools can read.
+"""
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from itertools import repeat
+from pathlib import Path
+from types import ModuleType
+import argparse
+import importlib.util
+import json
+import logging
+import re
+import time
+import tracemalloc
+
+from aoclib import profiling
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_PROFILE_DIR = BASE_DIR / "profiles"
+
+DAY_DIR_RE = re.compile(r"^day(\d+)$")
+
+# The solve function for each part
+PART_FUNCS = {1: "solve", 2: "solve2"}
+
+FMT_TABLE = "table"
+FMT_JSON = "json"
+OUTPUT_FORMATS = (FMT_TABLE, FMT_JSON)
+
+
+logging.basicConfig(format="%(message)s", stream=sys.stderr, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class UsageError(Exception):
+    """A UsageError is raised when there's an issue parsing the command-line options."""
+
+
+@dataclass
+class PartResult:
+    """The answer and the cost of running one part of one day's puzzle."""
+    day: int
+    part: int
+    answer: Any
+    infile: Optional[str]
+    parse_time: float
+    solve_time: float
+    parse_peak: Optional[int] = None
+    solve_peak: Optional[int] = None
+    max_rss: Optional[int] = None
+
+    @property
+    def total_time(self) -> float:
+        return self.parse_time + self.solve_time
+
+
+def find_days() -> Dict[int, Path]:
+    """Return the path of each dayN/dayN.py module, keyed by day number."""
+    days = {}
+    for path in BASE_DIR.iterdir():
+        m = DAY_DIR_RE.match(path.name)
+        if m and (path / f"{path.name}.py").is_file():
+            days[int(m.group(1))] = path / f"{path.name}.py"
+    return dict(sorted(days.items()))
+
+def load_day(day: int) -> ModuleType:
+    """Import the module for the given day (once) and return it."""
+    name = f"day{day}"
+    if name in sys.modules:
+        return sys.modules[name]
+    path = BASE_DIR / name / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+def input_path(module: ModuleType, infile: Optional[str] = None) -> Path:
+    """Return the input file for a day's module, relative to its directory."""
+    return Path(module.__file__).parent / (infile or module.INPUTFILE)
+
+def max_rss() -> Optional[int]:
+    """Return the peak resident set size of this process, in bytes."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return rss
+    return rss * 1024
+
+def run_part(
+    day: int,
+    part: int,
+    infile: Optional[str] = None,
+    trace_memory: bool = False,
+    profile_dir: Optional[str] = None,
+) -> PartResult:
+    """Run one part of one day, timing the parse and solve phases.
+
+    If profile_dir is given, the solve phase runs under cProfile and its
+    profile is saved there.
+    """
+    module = load_day(day)
+    solver = getattr(module, PART_FUNCS[part])
+    path = input_path(module, infile)
+
+    parse_peak = solve_peak = None
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    lines = module.load_input(str(path))
+    parse_time = time.perf_counter() - start
+    if trace_memory:
+        _, parse_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    if profile_dir:
+        answer, stats = profiling.profile_call(solver, lines)
+    else:
+        answer = solver(lines)
+    solve_time = time.perf_counter() - start
+    if trace_memory:
+        _, solve_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    if profile_dir:
+        stem = f"day{day}.part{part}"
+        if infile:
+            stem += f".{Path(infile).stem}"
+        pstats_path, collapsed_path = profiling.save_profile(stats, Path(profile_dir) / stem)
+        logger.info(f"Wrote {pstats_path} and {collapsed_path.name}")
+
+    return PartResult(
+        day=day,
+        part=part,
+        answer=answer,
+        infile=infile,
+        parse_time=parse_time,
+        solve_time=solve_time,
+        parse_peak=parse_peak,
+        solve_peak=solve_peak,
+        max_rss=max_rss(),
+    )
+
+def run_jobs(
+    jobs: Sequence[Tuple[int, int, Optional[str]]],
+    max_workers: int = 1,
+    trace_memory: bool = False,
+    profile_dir: Optional[str] = None,
+) -> List[PartResult]:
+    """Run (day, part, infile) jobs, serially or in a process pool.
+
+    Results are returned in job order either way.
+    """
+    if max_workers <= 1:
+        return [
+            run_part(day, part, infile, trace_memory, profile_dir)
+            for day, part, infile in jobs
+        ]
+    days, parts, infiles = zip(*jobs) if jobs else ((), (), ())
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            run_part, days, parts, infiles, repeat(trace_memory), repeat(profile_dir)
+        ))
+
+
+# Output
+
+def _fmt_bytes(nbytes: Optional[int]) -> str:
+    if nbytes is None:
+        return "-"
+    return f"{nbytes / 2**20:.1f}M"
+
+def format_table(results: Sequence[PartResult], wall_time: Optional[float] = None) -> str:
+    header = ("day", "part", "input", "answer", "parse", "solve", "total",
+              "parse mem", "solve mem", "max rss")
+    rows = [header]
+    for r in results:
+        rows.append((
+            str(r.day),
+            str(r.part),
+            r.infile or "-",
+            str(r.answer),
+            f"{r.parse_time * 1000:.2f}ms",
+            f"{r.solve_time * 1000:.2f}ms",
+            f"{r.total_time * 1000:.2f}ms",
+            _fmt_bytes(r.parse_peak),
+            _fmt_bytes(r.solve_peak),
+            _fmt_bytes(r.max_rss),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [row[0].rjust(widths[0]), row[1].rjust(widths[1])]
+        cells += [row[2].ljust(widths[2]), row[3].ljust(widths[3])]
+        cells += [cell.rjust(width) for cell, width in zip(row[4:], widths[4:])]
+        lines.append("  ".join(cells).rstrip())
+    total = sum(r.total_time for r in results)
+    summary = f"{len(results)} parts in {total * 1000:.2f}ms"
+    if wall_time is not None:
+        summary += f" ({wall_time * 1000:.2f}ms wall)"
+    lines.append(summary)
+    return "\n".join(lines)
+
+def format_json(results: Sequence[PartResult]) -> str:
+    records = []
+    for r in results:
+        record = asdict(r)
+        record["total_time"] = r.total_time
+        records.append(record)
+    return json.dumps(records, indent=2, default=str)
+
+
+# Command line
+
+def parse_day_spec(spec: str) -> List[int]:
+    """Parse a day list like '1-5,7,9' into a sorted list of day numbers."""
+    days = set()
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            if "-" in item:
+                first, last = item.split("-", 1)
+                days.update(range(int(first), int(last) + 1))
+            else:
+                days.add(int(item))
+        except ValueError:
+            raise UsageError(f"Unrecognized day list '{spec}'")
+    return sorted(days)
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--days",
+        "-d",
+        help="The days to run, e.g. '1-5,7' (default: all)",
+    )
+    parser.add_argument(
+        "--parts",
+        "-p",
+        default="1,2",
+        help="The parts to run, e.g. '1' or '1,2' (default: both)",
+    )
+    parser.add_argument(
+        "--input",
+        action="append",
+        help="Input file name, relative to each day's directory (default: INPUTFILE)."
+        " May be repeated.",
+    )
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Run the daily solutions and report time and memory per part."
+    )
+    add_arguments(parser)
+    parser.add_argument(
+        "--format",
+        "-f",
+        default=FMT_TABLE,
+        help="The output format (table or json)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes to run jobs in (default: 1)",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        "-m",
+        action="store_true",
+        help="Record tracemalloc peaks per phase (slows down the solvers)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=str(DEFAULT_PROFILE_DIR),
+        metavar="DIR",
+        help="Profile each solve phase, writing .pstats and .collapsed files"
+        f" to DIR (default: {DEFAULT_PROFILE_DIR.name}/)",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Produce debug output",
+    )
+    opt = parser.parse_args()
+
+    if opt.format not in OUTPUT_FORMATS:
+        raise UsageError(f"Unrecognized format '{opt.format}'")
+    if opt.jobs < 1:
+        raise UsageError("--jobs must be at least 1")
+    return opt
+
+def select_jobs(opt) -> List[Tuple[int, int, Optional[str]]]:
+    """Return the (day, part, infile) jobs requested on the command line, in order."""
+    available = find_days()
+    days = parse_day_spec(opt.days) if opt.days else list(available)
+    missing = [day for day in days if day not in available]
+    if missing:
+        raise UsageError(f"No module for day(s) {', '.join(map(str, missing))}")
+    parts = parse_day_spec(opt.parts)
+    if not parts or any(part not in PART_FUNCS for part in parts):
+        raise UsageError(f"Unrecognized part list '{opt.parts}'")
+    infiles = opt.input or [None]
+    return [(day, part, infile) for day in days for part in parts for infile in infiles]
+
+def main() -> int:
+    opt = parse_args()
+    if opt.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("[debug mode]")
+
+    jobs = select_jobs(opt)
+    logger.debug(f"{len(jobs)} jobs on {opt.jobs} worker(s)")
+    start = time.perf_counter()
+    results = run_jobs(jobs, opt.jobs, opt.trace_memory, opt.profile)
+    wall_time = time.perf_counter() - start
+
+    if opt.format == FMT_JSON:
+        print(format_json(results))
+    else:
+        print(format_table(results, wall_time))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())